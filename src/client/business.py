@@ -3,9 +3,11 @@
 This module handles business entities and their interactions.
 """
 
+from array import array
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional
-from uuid import uuid4
+from typing import List, Dict, FrozenSet, Optional, Set
+from itertools import count
+import logging
 import time
 
 from shared.constants import (
@@ -18,14 +20,37 @@ from shared.logger import get_logger
 
 logger = get_logger(__name__)
 
-@dataclass
+# Monotonic id sources for contracts and conflicts
+_contract_ids = count(1)
+_conflict_ids = count(1)
+
+# Resource names interned to small integer ids shared by all businesses
+RESOURCE_IDS: Dict[str, int] = {}
+RESOURCE_NAMES: List[str] = []
+
+def resource_id(name: str) -> int:
+    """Get the interned id of a resource name, assigning one if new.
+    
+    Args:
+        name: Resource name
+    
+    Returns:
+        Integer resource id
+    """
+    rid = RESOURCE_IDS.get(name)
+    if rid is None:
+        rid = RESOURCE_IDS[name] = len(RESOURCE_NAMES)
+        RESOURCE_NAMES.append(name)
+    return rid
+
+@dataclass(slots=True)
 class Resource:
     """Resource class representing business inventory items."""
     name: str
     quantity: int
     value: float
 
-@dataclass
+@dataclass(slots=True)
 class Contract:
     """Contract class representing business agreements."""
     seller: 'Business'
@@ -33,32 +58,59 @@ class Contract:
     resource: str
     quantity: int
     price: float
-    id: str = field(default_factory=lambda: str(uuid4()))
+    id: int = field(default_factory=lambda: next(_contract_ids))
     is_fulfilled: bool = False
-    created_at: float = field(default_factory=time.time)
+    created_at: int = field(default_factory=time.monotonic_ns)
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class Conflict:
-    """Conflict class representing business disputes."""
+    """Conflict class representing business disputes.
+    
+    Conflicts compare and hash by identity so they can live in sets.
+    """
     type: ConflictType
     description: str
-    parties: List['Business']
-    id: str = field(default_factory=lambda: str(uuid4()))
+    parties: FrozenSet['Business'] = field(default_factory=frozenset)
+    id: int = field(default_factory=lambda: next(_conflict_ids))
     resolution_method: Optional[ResolutionMethod] = None
     mediator: Optional[str] = None
     is_resolved: bool = False
-    created_at: float = field(default_factory=time.time)
-    resolved_at: Optional[float] = None
+    created_at: int = field(default_factory=time.monotonic_ns)
+    resolved_at: Optional[int] = None
     
     def resolve(self) -> None:
-        """Mark the conflict as resolved."""
+        """Mark the conflict as resolved and drop it from its parties."""
         self.is_resolved = True
-        self.resolved_at = time.time()
-        logger.info(f"Conflict {self.id} resolved via {self.resolution_method.value}")
+        self.resolved_at = time.monotonic_ns()
+        for party in self.parties:
+            party.conflicts.discard(self)
+            party.dirty = True
+        logger.info("Conflict %s resolved via %s", self.id, self.resolution_method.value)
+
+@dataclass(slots=True)
+class ContractSpec:
+    """Parameters of a contract to be created in bulk."""
+    seller: 'Business'
+    buyer: 'Business'
+    resource: str
+    quantity: int
+    price: float
 
 class Business:
     """Business class representing game entities."""
     
+    __slots__ = (
+        "name",
+        "type",
+        "owner",
+        "money",
+        "_res_qty",
+        "_res_val",
+        "contracts",
+        "conflicts",
+        "dirty"
+    )
+    
     def __init__(self, name: str, type: BusinessType, owner: str):
         """Initialize a business.
         
@@ -72,12 +124,58 @@ class Business:
         self.owner = owner
         self.money = STARTING_MONEY
         
-        # Resources and contracts
-        self.resources: Dict[str, Resource] = {}
+        # Inventory quantity and unit value, indexed by resource id
+        self._res_qty = array("q")
+        self._res_val = array("d")
+        
+        # Contracts and conflicts
         self.contracts: List[Contract] = []
-        self.conflicts: List[Conflict] = []
+        self.conflicts: Set[Conflict] = set()
+        
+        # Set whenever displayed state changes; cleared by the UI
+        self.dirty = True
         
-        logger.info(f"Created business: {self.name} ({self.type.value})")
+        logger.info("Created business: %s (%s)", self.name, self.type.value)
+    
+    @property
+    def resources(self) -> Dict[str, Resource]:
+        """Snapshot of the resources currently held, keyed by name."""
+        qty, val = self._res_qty, self._res_val
+        return {
+            RESOURCE_NAMES[rid]: Resource(RESOURCE_NAMES[rid], qty[rid], val[rid])
+            for rid in range(len(qty))
+            if qty[rid] > 0
+        }
+    
+    def quantity_of(self, name: str) -> int:
+        """Get the held quantity of a resource.
+        
+        Args:
+            name: Resource name
+        
+        Returns:
+            Quantity held, 0 if none
+        """
+        rid = RESOURCE_IDS.get(name)
+        if rid is None or rid >= len(self._res_qty):
+            return 0
+        return self._res_qty[rid]
+    
+    def _resource_slot(self, name: str) -> int:
+        """Get the inventory slot of a resource, growing the arrays if needed.
+        
+        Args:
+            name: Resource name
+        
+        Returns:
+            Integer resource id
+        """
+        rid = resource_id(name)
+        missing = rid + 1 - len(self._res_qty)
+        if missing > 0:
+            self._res_qty.extend([0] * missing)
+            self._res_val.extend([0.0] * missing)
+        return rid
     
     def add_resource(self, name: str, quantity: int, value: float) -> None:
         """Add a resource to inventory.
@@ -87,12 +185,11 @@ class Business:
             quantity: Resource quantity
             value: Resource value per unit
         """
-        if name in self.resources:
-            self.resources[name].quantity += quantity
-            self.resources[name].value = value
-        else:
-            self.resources[name] = Resource(name, quantity, value)
-        logger.debug(f"{self.name} added {quantity} {name} @ ${value}/unit")
+        rid = self._resource_slot(name)
+        self._res_qty[rid] += quantity
+        self._res_val[rid] = value
+        self.dirty = True
+        logger.debug("%s added %s %s @ $%s/unit", self.name, quantity, name, value)
     
     def remove_resource(self, name: str, quantity: int) -> bool:
         """Remove a resource from inventory.
@@ -104,19 +201,33 @@ class Business:
         Returns:
             True if resource was removed, False if insufficient quantity
         """
-        if name not in self.resources:
+        # Unknown names and slots past this business's arrays are not held
+        rid = RESOURCE_IDS.get(name)
+        if rid is None or rid >= len(self._res_qty) or self._res_qty[rid] == 0:
             return False
         
-        if self.resources[name].quantity < quantity:
+        if self._res_qty[rid] < quantity:
             return False
         
-        self.resources[name].quantity -= quantity
-        if self.resources[name].quantity == 0:
-            del self.resources[name]
-        
-        logger.debug(f"{self.name} removed {quantity} {name}")
+        self._res_qty[rid] -= quantity
+        self.dirty = True
+        logger.debug("%s removed %s %s", self.name, quantity, name)
         return True
     
+    def _transfer_resource(self, name: str, quantity: int, value: float = None) -> None:
+        """Apply one side of an already validated trade without logging.
+        
+        Args:
+            name: Resource name
+            quantity: Units received, negative for units handed over
+            value: New value per unit, None to keep the current one
+        """
+        rid = self._resource_slot(name)
+        self._res_qty[rid] += quantity
+        if value is not None:
+            self._res_val[rid] = value
+        self.dirty = True
+    
     def add_money(self, amount: float) -> None:
         """Add money to the business.
         
@@ -124,7 +235,9 @@ class Business:
             amount: Amount to add
         """
         self.money += amount
-        logger.debug(f"{self.name} added ${amount:,.2f}")
+        self.dirty = True
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("%s added $%s", self.name, f"{amount:,.2f}")
     
     def remove_money(self, amount: float) -> bool:
         """Remove money from the business.
@@ -139,7 +252,9 @@ class Business:
             return False
         
         self.money -= amount
-        logger.debug(f"{self.name} removed ${amount:,.2f}")
+        self.dirty = True
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("%s removed $%s", self.name, f"{amount:,.2f}")
         return True
 
 class BusinessManager:
@@ -150,6 +265,9 @@ class BusinessManager:
         self.businesses: Dict[str, Business] = {}
         self.contracts: List[Contract] = []
         self.conflicts: List[Conflict] = []
+        
+        # Businesses in creation order
+        self._business_list: List[Business] = []
     
     def create_business(
         self,
@@ -169,8 +287,22 @@ class BusinessManager:
         """
         business = Business(name, type, owner)
         self.businesses[name] = business
+        self._business_list.append(business)
         return business
     
+    def business_at(self, index: int) -> Optional[Business]:
+        """Get a business by creation order.
+        
+        Args:
+            index: Position in creation order
+        
+        Returns:
+            The business, or None if fewer have been created
+        """
+        if 0 <= index < len(self._business_list):
+            return self._business_list[index]
+        return None
+    
     def create_contract(
         self,
         seller: Business,
@@ -191,18 +323,9 @@ class BusinessManager:
         Returns:
             Created contract or None if invalid
         """
-        # Validate contract
-        if resource not in seller.resources:
-            logger.warning(f"Contract failed: {seller.name} does not have {resource}")
-            return None
-        
-        if seller.resources[resource].quantity < quantity:
-            logger.warning(f"Contract failed: {seller.name} has insufficient {resource}")
-            return None
-        
-        if not buyer.remove_money(price):
-            logger.warning(f"Contract failed: {buyer.name} has insufficient funds")
+        if not self._validate_contract(seller, buyer, resource, quantity, price):
             return None
+        buyer.remove_money(price)
         
         # Create and register contract
         contract = Contract(
@@ -215,7 +338,6 @@ class BusinessManager:
         
         seller.contracts.append(contract)
         buyer.contracts.append(contract)
-        self.contracts.append(contract)
         
         # Transfer resources and money
         seller.remove_resource(resource, quantity)
@@ -223,9 +345,91 @@ class BusinessManager:
         buyer.add_resource(resource, quantity, price / quantity)
         
         contract.is_fulfilled = True
-        logger.info(f"Created contract: {contract}")
+        self.contracts.append(contract)
+        logger.info("Created contract: %s", contract)
         return contract
     
+    def _validate_contract(
+        self,
+        seller: Business,
+        buyer: Business,
+        resource: str,
+        quantity: int,
+        price: float
+    ) -> bool:
+        """Check that a contract can be carried out right now.
+        
+        Args:
+            seller: Selling business
+            buyer: Buying business
+            resource: Resource name
+            quantity: Resource quantity
+            price: Total price
+        
+        Returns:
+            True if the contract is valid against current balances
+        """
+        if quantity <= 0 or price <= 0:
+            logger.warning("Contract failed: quantity and price must be positive")
+            return False
+        
+        held = seller.quantity_of(resource)
+        if held == 0:
+            logger.warning("Contract failed: %s does not have %s", seller.name, resource)
+            return False
+        
+        if held < quantity:
+            logger.warning("Contract failed: %s has insufficient %s", seller.name, resource)
+            return False
+        
+        if buyer.money < price:
+            logger.warning("Contract failed: %s has insufficient funds", buyer.name)
+            return False
+        return True
+    
+    def create_contracts_bulk(self, specs: List[ContractSpec]) -> List[Contract]:
+        """Create many contracts in one pass.
+        
+        Specs are validated and carried out in order exactly as
+        create_contract would, so money and stock received from earlier
+        specs count towards later ones. Stock moves through
+        Business._transfer_resource, which skips the per-call logging of
+        the public mutators.
+        
+        Args:
+            specs: Contracts to create, applied in order
+        
+        Returns:
+            Created contracts; invalid specs are skipped
+        """
+        created: List[Contract] = []
+        for spec in specs:
+            seller, buyer, resource = spec.seller, spec.buyer, spec.resource
+            if not self._validate_contract(seller, buyer, resource, spec.quantity, spec.price):
+                continue
+            
+            # Transfer resources and money
+            buyer.money -= spec.price
+            seller.money += spec.price
+            seller._transfer_resource(resource, -spec.quantity)
+            buyer._transfer_resource(resource, spec.quantity, spec.price / spec.quantity)
+            
+            contract = Contract(
+                seller=seller,
+                buyer=buyer,
+                resource=resource,
+                quantity=spec.quantity,
+                price=spec.price,
+                is_fulfilled=True
+            )
+            seller.contracts.append(contract)
+            buyer.contracts.append(contract)
+            self.contracts.append(contract)
+            created.append(contract)
+        
+        logger.info("Created %d of %d bulk contracts", len(created), len(specs))
+        return created
+    
     def create_conflict(
         self,
         type: ConflictType,
@@ -245,14 +449,20 @@ class BusinessManager:
         conflict = Conflict(
             type=type,
             description=description,
-            parties=parties
+            parties=frozenset(parties)
         )
         
-        for party in parties:
-            party.conflicts.append(conflict)
+        for party in conflict.parties:
+            party.conflicts.add(conflict)
+            party.dirty = True
         self.conflicts.append(conflict)
         
-        logger.info(f"Created conflict: {type.value} between {[p.name for p in parties]}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Created conflict: %s between %s",
+                type.value,
+                [p.name for p in parties]
+            )
         return conflict
     
     def update(self, delta_time: float) -> None:
@@ -261,13 +471,8 @@ class BusinessManager:
         Args:
             delta_time: Time elapsed since last update
         """
-        # Update contracts and conflicts
-        for contract in self.contracts:
-            if not contract.is_fulfilled:
-                # Check if contract conditions are met
-                pass
-        
+        # Contracts are settled when created, so only conflicts need a tick
         for conflict in self.conflicts:
             if not conflict.is_resolved:
                 # Update conflict state
-                pass
\ No newline at end of file
+                pass
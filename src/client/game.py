@@ -3,10 +3,18 @@
 This module contains the core game engine and main game loop.
 """
 
+import logging
 import sys
+from functools import cached_property
 from pathlib import Path
+from typing import List
 import pygame
 import pygame_gui
+from pygame import (
+    QUIT, KEYDOWN, USEREVENT, NOEVENT,
+    K_ESCAPE, K_b, K_t, K_m,
+    K_w, K_a, K_s, K_d, K_UP, K_DOWN, K_LEFT, K_RIGHT
+)
 from pygame.math import Vector2
 
 from shared.constants import (
@@ -20,19 +28,49 @@ from shared.constants import (
     BusinessType,
     PlayerRole,
     ConflictType,
-    TILE_SIZE
+    TILE_SIZE,
+    MAX_DELTA_TIME,
+    TICK_RATE,
+    FIXED_TIMESTEP,
+    IDLE_WAIT_MS,
+    BUSINESS_TICK
 )
 from shared.logger import get_logger
-from client.player import Player
+from client.player import Player, MOVE_UP, MOVE_DOWN, MOVE_LEFT, MOVE_RIGHT
 from client.tilemap import create_test_map
 from client.ui.menu import MenuManager
 from client.ui.business import BusinessPanel
 from client.ui.trading import TradingPanel
 from client.ui.mediation import MediationPanel
-from client.business import BusinessManager
+from client.business import BusinessManager, logger as business_logger
 
 logger = get_logger(__name__)
 
+# Per-frame pygame entry points, bound once to skip attribute lookups
+_event_get = pygame.event.get
+_event_wait = pygame.event.wait
+_get_pressed = pygame.key.get_pressed
+
+# pygame_gui's custom event types
+UI_EVENT_TYPES = frozenset(
+    getattr(pygame_gui, name) for name in dir(pygame_gui) if name.startswith("UI_")
+)
+
+# Event types the game or pygame_gui consume; all others are blocked at SDL
+ALLOWED_EVENT_TYPES = [
+    QUIT,
+    KEYDOWN,
+    pygame.KEYUP,
+    pygame.TEXTINPUT,
+    pygame.MOUSEBUTTONDOWN,
+    pygame.MOUSEBUTTONUP,
+    pygame.MOUSEMOTION,
+    pygame.MOUSEWHEEL,
+    pygame.WINDOWEXPOSED,
+    USEREVENT,
+    *UI_EVENT_TYPES
+]
+
 class Game:
     """Main game class handling the game loop and core functionality."""
     
@@ -49,10 +87,58 @@ class Game:
         pygame.display.set_caption(WINDOW_TITLE)
         
         # Set up the display
-        self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+        # Vsync'd surface: frame pacing comes from the display, not the clock
+        self.screen = pygame.display.set_mode(
+            (WINDOW_WIDTH, WINDOW_HEIGHT),
+            pygame.SCALED,
+            vsync=1
+        )
         self.clock = pygame.time.Clock()
         self.is_running = True
         
+        # Keep unused event types out of the queue entirely
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(ALLOWED_EVENT_TYPES)
+        
+        # Semi-transparent overlay drawn over the world while paused
+        self._pause_overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)).convert()
+        self._pause_overlay.fill(COLOR_BLACK)
+        self._pause_overlay.set_alpha(128)
+        
+        # Screen regions to present when only part of the frame changed
+        self._dirty: List[pygame.Rect] = []
+        self._full_redraw = True
+        
+        # Set by input; an idle frame is skipped entirely while clear
+        self._ui_dirty = True
+        
+        # Set by logic steps that moved the player or the camera
+        self._scene_dirty = True
+        
+        # Player's screen rect as last presented, so its old spot is repainted
+        self._last_player_rect = pygame.Rect(0, 0, 0, 0)
+        
+        # Whether any pygame_gui element is on screen this frame, and the
+        # screen rects they cover
+        self._any_ui_visible = True
+        self._ui_rects: List[pygame.Rect] = []
+        
+        # Key press handlers
+        self._key_handlers = {
+            K_ESCAPE: self._toggle_pause,
+            K_b: self._toggle_business_panel,
+            K_t: self._show_trading_panel,
+            K_m: self._show_mediation_panel
+        }
+        
+        # Scene renderer for each game state
+        self._renderers = {
+            GameState.MENU: self._render_menu,
+            GameState.PLAYING: self._render_world,
+            GameState.PAUSED: self._render_paused,
+            GameState.GAME_OVER: self._render_menu
+        }
+        
         # Create UI manager with theme
         theme_path = ASSET_DIR / "theme.json"
         try:
@@ -76,16 +162,24 @@ class Game:
         self.menu_manager = MenuManager(self.ui_manager)
         self.business_manager = BusinessManager()
         
-        # Create UI panels
-        self.business_panel = BusinessPanel(self.ui_manager)
-        self.trading_panel = TradingPanel(self.ui_manager)
-        self.mediation_panel = MediationPanel(self.ui_manager)
+        # UI panels built so far; each is created on first use
+        self._panels: list = []
         
-        # Create camera offset
-        self.camera_offset = pygame.Vector2(0, 0)
+        # Camera offset in whole pixels
+        self._cam_ix = 0
+        self._cam_iy = 0
         
-        # Create tilemap
+        # Create tilemap and render its static background up front
         self.tilemap = create_test_map()
+        self.tilemap.bake()
+        self._last_room = None
+        
+        # Time not yet handed to the business simulation
+        self._business_accum = 0.0
+        
+        # Furthest the camera can scroll; the map size never changes
+        self._cam_max_x = max(0, self.tilemap.width * TILE_SIZE - WINDOW_WIDTH)
+        self._cam_max_y = max(0, self.tilemap.height * TILE_SIZE - WINDOW_HEIGHT)
         
         # Create player at center of screen
         self.player = Player(
@@ -97,190 +191,361 @@ class Game:
         
         logger.info("Game initialized successfully")
     
-    def _create_test_businesses(self):
-        """Create test businesses for development."""
-        # Create a retail business
-        retail = self.business_manager.create_business(
-            name="Varygen Mart",
-            type=BusinessType.RETAIL,
-            owner="Player1"
-        )
-        retail.add_resource("Electronics", 100, 50.0)
-        retail.add_resource("Furniture", 50, 200.0)
-        
-        # Create a manufacturing business
-        manufacturing = self.business_manager.create_business(
-            name="Varygen Industries",
-            type=BusinessType.MANUFACTURING,
-            owner="Player2"
-        )
-        manufacturing.add_resource("Raw Materials", 500, 20.0)
-        manufacturing.add_resource("Machinery", 10, 1000.0)
-        
-        # Create a test contract
-        self.business_manager.create_contract(
-            seller=manufacturing,
-            buyer=retail,
-            resource="Raw Materials",
-            quantity=50,
-            price=1500.0
-        )
+    @cached_property
+    def business_panel(self) -> BusinessPanel:
+        """Business panel, built on first use."""
+        return self._add_panel(BusinessPanel(self.ui_manager))
+    
+    @cached_property
+    def trading_panel(self) -> TradingPanel:
+        """Trading panel, built on first use."""
+        return self._add_panel(TradingPanel(self.ui_manager))
+    
+    @cached_property
+    def mediation_panel(self) -> MediationPanel:
+        """Mediation panel, built on first use."""
+        return self._add_panel(MediationPanel(self.ui_manager))
+    
+    def _add_panel(self, panel):
+        """Register a newly built panel for event dispatch and drawing.
         
-        # Create a test conflict
-        self.business_manager.create_conflict(
-            type=ConflictType.CONTRACT_BREACH,
-            description="Failed to deliver raw materials on time",
-            parties=[retail, manufacturing]
-        )
+        Args:
+            panel: The panel that was just created
         
-        # Create another test conflict
-        self.business_manager.create_conflict(
-            type=ConflictType.RESOURCE_DISPUTE,
-            description="Dispute over machinery maintenance costs",
-            parties=[manufacturing, retail]
+        Returns:
+            The same panel
+        """
+        self._panels.append(panel)
+        return panel
+    
+    def _create_test_businesses(self):
+        """Create test businesses for development."""
+        # Silence per-call business logging during bulk setup
+        level = business_logger.level
+        business_logger.setLevel(logging.WARNING)
+        try:
+            # Create a retail business
+            retail = self.business_manager.create_business(
+                name="Varygen Mart",
+                type=BusinessType.RETAIL,
+                owner="Player1"
+            )
+            retail.add_resource("Electronics", 100, 50.0)
+            retail.add_resource("Furniture", 50, 200.0)
+            
+            # Create a manufacturing business
+            manufacturing = self.business_manager.create_business(
+                name="Varygen Industries",
+                type=BusinessType.MANUFACTURING,
+                owner="Player2"
+            )
+            manufacturing.add_resource("Raw Materials", 500, 20.0)
+            manufacturing.add_resource("Machinery", 10, 1000.0)
+            
+            # Create a test contract
+            self.business_manager.create_contract(
+                seller=manufacturing,
+                buyer=retail,
+                resource="Raw Materials",
+                quantity=50,
+                price=1500.0
+            )
+            
+            # Create a test conflict
+            self.business_manager.create_conflict(
+                type=ConflictType.CONTRACT_BREACH,
+                description="Failed to deliver raw materials on time",
+                parties=[retail, manufacturing]
+            )
+            
+            # Create another test conflict
+            self.business_manager.create_conflict(
+                type=ConflictType.RESOURCE_DISPUTE,
+                description="Dispute over machinery maintenance costs",
+                parties=[manufacturing, retail]
+            )
+        finally:
+            business_logger.setLevel(level)
+        logger.info(
+            "Initialized %d businesses, %d contracts, %d conflicts",
+            len(self.business_manager.businesses),
+            len(self.business_manager.contracts),
+            len(self.business_manager.conflicts)
         )
         
         # Show the retail business panel for testing
         self.business_panel.show(retail)
     
-    def handle_events(self):
-        """Handle all game events."""
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
+    def handle_events(self, events: list) -> None:
+        """Handle all game events.
+        
+        Args:
+            events: Events drained from the queue this frame
+        """
+        for event in events:
+            # Any input may change the UI anywhere, so present a full frame
+            self._full_redraw = True
+            self._ui_dirty = True
+            
+            event_type = event.type
+            if event_type == QUIT:
                 self.is_running = False
             
-            # Handle UI events
+            # Handle UI events; only pygame_gui events reach the panels
             self.ui_manager.process_events(event)
-            self.menu_manager.handle_event(event)
-            self.business_panel.handle_event(event)
-            self.trading_panel.handle_event(event)
+            if event_type in UI_EVENT_TYPES:
+                self.menu_manager.handle_event(event)
+                if self.menu_manager.quit_requested:
+                    self.is_running = False
+                for panel in self._panels:
+                    if panel.visible:
+                        panel.handle_event(event)
             
             # Handle keyboard input
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    if self.state == GameState.PLAYING:
-                        self.state = GameState.PAUSED
-                        self.menu_manager.show_state(GameState.PAUSED)
-                    elif self.state == GameState.PAUSED:
-                        self.state = GameState.PLAYING
-                        self.menu_manager.show_state(GameState.PLAYING)
-                elif event.key == pygame.K_b and self.state == GameState.PLAYING:
-                    # Toggle business panel
-                    if self.business_panel.visible:
-                        self.business_panel.hide()
-                    else:
-                        # Show panel for first business (for testing)
-                        first_business = next(iter(self.business_manager.businesses.values()))
-                        self.business_panel.show(first_business)
-                elif event.key == pygame.K_t and self.state == GameState.PLAYING:
-                    # Show trading panel (for testing)
-                    if not self.trading_panel.visible:
-                        businesses = list(self.business_manager.businesses.values())
-                        if len(businesses) >= 2:
-                            self.trading_panel.show(businesses[0], businesses[1])
-                elif event.key == pygame.K_m and self.state == GameState.PLAYING:
-                    # Show mediation panel for first unresolved conflict (for testing)
-                    for business in self.business_manager.businesses.values():
-                        for conflict in business.conflicts:
-                            if not conflict.is_resolved:
-                                self.mediation_panel.show(conflict)
-                                break
-                        if self.mediation_panel.visible:
-                            break
+            elif event_type == KEYDOWN:
+                handler = self._key_handlers.get(event.key)
+                if handler:
+                    handler()
+    
+    def _toggle_pause(self) -> None:
+        """Toggle between the playing and paused states."""
+        if self.state == GameState.PLAYING:
+            self.state = GameState.PAUSED
+            self.menu_manager.show_state(GameState.PAUSED)
+        elif self.state == GameState.PAUSED:
+            self.state = GameState.PLAYING
+            self.menu_manager.show_state(GameState.PLAYING)
     
-    def update(self, delta_time: float):
+    def _toggle_business_panel(self) -> None:
+        """Toggle the business panel while playing."""
+        if self.state != GameState.PLAYING:
+            return
+        if self.business_panel.visible:
+            self.business_panel.hide()
+        else:
+            # Show panel for first business (for testing)
+            first_business = self.business_manager.business_at(0)
+            if first_business:
+                self.business_panel.show(first_business)
+    
+    def _show_trading_panel(self) -> None:
+        """Show the trading panel while playing (for testing)."""
+        if self.state != GameState.PLAYING or self.trading_panel.visible:
+            return
+        first = self.business_manager.business_at(0)
+        second = self.business_manager.business_at(1)
+        if first and second:
+            self.trading_panel.show(first, second)
+    
+    def _show_mediation_panel(self) -> None:
+        """Show the mediation panel for the first unresolved conflict (for testing)."""
+        if self.state != GameState.PLAYING:
+            return
+        for business in self.business_manager.businesses.values():
+            # Conflicts are held in a set; take the oldest first
+            for conflict in sorted(business.conflicts, key=lambda c: c.id):
+                if not conflict.is_resolved:
+                    self.mediation_panel.show(conflict)
+                    return
+    
+    def update(self, delta_time: float, keys: pygame.key.ScancodeWrapper):
         """Update game state.
         
         Args:
             delta_time: Time elapsed since last update in seconds
+            keys: Keyboard state sampled once for this frame
         """
-        # Update UI
-        self.ui_manager.update(delta_time)
+        # Update UI only while something is on screen
+        visible_panels = [panel for panel in self._panels if panel.visible]
+        self._any_ui_visible = self.menu_manager.has_visible or bool(visible_panels)
+        if self._any_ui_visible:
+            self.ui_manager.update(delta_time)
         
         # Only update game logic when playing
         if self.state == GameState.PLAYING:
-            # Store old position for collision checking
-            old_pos = self.player.position.copy()
-            
-            # Handle player input and update
-            keys = pygame.key.get_pressed()
-            self.player.handle_input(keys)
-            self.player.update(delta_time)
+            # Pack movement keys into one mask for the player
+            move_mask = (
+                (keys[K_w] | keys[K_UP]) * MOVE_UP
+                | (keys[K_s] | keys[K_DOWN]) * MOVE_DOWN
+                | (keys[K_a] | keys[K_LEFT]) * MOVE_LEFT
+                | (keys[K_d] | keys[K_RIGHT]) * MOVE_RIGHT
+            )
             
-            # Check for collisions with tilemap
-            if self.tilemap.check_collision(self.player.rect):
-                # If collision occurred, revert to old position
-                self.player.position = old_pos
-                self.player.rect.center = old_pos
+            # Handle player input and move against the tilemap
+            self.player.handle_input(move_mask)
+            self.player.update(delta_time, self.tilemap.check_collision)
+            if self.player.moving:
+                self._scene_dirty = True
             
-            # Update camera to follow player
-            target_x = self.player.position.x - WINDOW_WIDTH // 2
-            target_y = self.player.position.y - WINDOW_HEIGHT // 2
+            # Update camera to follow player, clamped to map bounds
+            camera_x = min(max(0, int(self.player.x - WINDOW_WIDTH // 2)), self._cam_max_x)
+            camera_y = min(max(0, int(self.player.y - WINDOW_HEIGHT // 2)), self._cam_max_y)
+            if camera_x != self._cam_ix or camera_y != self._cam_iy:
+                # Scrolling shifts every tile, so the whole screen changes
+                self._cam_ix = camera_x
+                self._cam_iy = camera_y
+                self._full_redraw = True
+                self._scene_dirty = True
             
-            # Clamp camera to map bounds
-            max_x = self.tilemap.width * TILE_SIZE - WINDOW_WIDTH
-            max_y = self.tilemap.height * TILE_SIZE - WINDOW_HEIGHT
-            
-            self.camera_offset.x = max(0, min(target_x, max_x))
-            self.camera_offset.y = max(0, min(target_y, max_y))
-            
-            # Log room changes for debugging
-            current_room = self.tilemap.get_room_at(self.player.position)
-            if hasattr(self, '_last_room') and self._last_room != current_room:
+            # Track room changes for the HUD and debug log
+            current_room = self.tilemap.get_room_at_tile(
+                int(self.player.x) // TILE_SIZE,
+                int(self.player.y) // TILE_SIZE
+            )
+            if self._last_room != current_room:
                 if current_room:
-                    logger.debug(f"Entered room: {current_room.name} ({current_room.room_type})")
+                    logger.debug("Entered room: %s (%s)", current_room.name, current_room.room_type)
                 else:
                     logger.debug("Left room")
-            self._last_room = current_room
+                self._last_room = current_room
             
-            # Update business system
-            self.business_manager.update(delta_time)
+            # The HUD only retitles labels whose values changed; the
+            # partial redraw repaints the scene under them before drawing
+            if self.menu_manager.update_hud(
+                role=self.menu_manager.selected_role.value,
+                money=self.player.money,
+                room=current_room.name if current_room else ""
+            ):
+                self._ui_dirty = True
             
-            # Update UI panels
-            if self.business_panel.visible:
-                self.business_panel.update_display()
-            if self.trading_panel.visible:
-                self.trading_panel.update_display()
-            if self.mediation_panel.visible:
-                self.mediation_panel.handle_event(pygame.event.Event(pygame.USEREVENT))
+            # Update business system and its panels at a slower rate;
+            # nothing there needs per-frame granularity
+            self._business_accum += delta_time
+            if self._business_accum >= BUSINESS_TICK:
+                self.business_manager.update(self._business_accum)
+                self._business_accum = 0.0
+                self._update_panels(visible_panels)
+    
+    def _update_panels(self, visible_panels: list) -> None:
+        """Refresh the visible UI panels from the business data.
+        
+        Args:
+            visible_panels: Panels currently on screen
+        """
+        for panel in visible_panels:
+            if isinstance(panel, BusinessPanel):
+                if panel.update_display():
+                    self._full_redraw = True
+                continue
+            if isinstance(panel, TradingPanel):
+                panel.update_display()
+            # Trading refreshes every tick and the mediation fee
+            # entry's cursor blinks, so keep presenting frames
+            self._full_redraw = True
     
     def render(self):
         """Render the game state to the screen."""
-        # Clear the screen
-        self.screen.fill(COLOR_WHITE)
+        # Nothing on screen changed since the last presented frame
+        if not (self._ui_dirty or self._scene_dirty or self._full_redraw):
+            return
         
-        # Only render game world when playing or paused
-        if self.state in [GameState.PLAYING, GameState.PAUSED]:
-            # Draw the tilemap with camera offset
-            self.tilemap.draw(self.screen, (int(self.camera_offset.x), int(self.camera_offset.y)))
-            
-            # Draw the player with camera offset
-            player_screen_pos = self.player.position - self.camera_offset
-            self.player.draw(self.screen, player_screen_pos)
-            
-            # Draw semi-transparent overlay when paused
-            if self.state == GameState.PAUSED:
-                overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
-                overlay.fill((0, 0, 0))
-                overlay.set_alpha(128)
-                self.screen.blit(overlay, (0, 0))
+        # Draw the state-specific scene
+        self._ui_rects = self._visible_ui_rects() if self._any_ui_visible else []
+        self._renderers[self.state]()
         
         # Draw UI
-        self.ui_manager.draw_ui(self.screen)
+        if self._any_ui_visible:
+            self.ui_manager.draw_ui(self.screen)
+            self._dirty.extend(self._ui_rects)
+        
+        # Update the display; unless the whole frame changed only present
+        # the changed regions
+        if self._full_redraw:
+            pygame.display.flip()
+            self._full_redraw = False
+        else:
+            pygame.display.update(self._dirty)
+        self._dirty.clear()
+        self._ui_dirty = False
+        self._scene_dirty = False
+    
+    def _render_menu(self) -> None:
+        """Render the background behind menu screens."""
+        self.screen.fill(COLOR_WHITE)
+    
+    def _render_world(self) -> None:
+        """Render the tilemap and player."""
+        camera = (self._cam_ix, self._cam_iy)
+        if self._full_redraw:
+            self.screen.fill(COLOR_WHITE)
+            
+            # Draw the tilemap with camera offset
+            self.tilemap.draw(self.screen, camera)
+        else:
+            # Only the player and the UI changed; restore the background the
+            # player uncovered and under every UI element, whose transparent
+            # parts would otherwise blend over their previous frame
+            screen_rect = self.screen.get_rect()
+            for area in (self._last_player_rect, *self._ui_rects):
+                area = area.clip(screen_rect)
+                self.screen.fill(COLOR_WHITE, area)
+                self.tilemap.draw_area(self.screen, camera, area)
+        
+        # Draw the player with camera offset
+        player_screen_pos = (
+            self.player.x - self._cam_ix,
+            self.player.y - self._cam_iy
+        )
+        self.player.draw(self.screen, player_screen_pos)
         
-        # Update the display
-        pygame.display.flip()
+        # Repaint both where the player was and where it is now
+        player_rect = self.player.rect.move(-self._cam_ix, -self._cam_iy)
+        self._dirty.append(self._last_player_rect)
+        self._dirty.append(player_rect)
+        self._last_player_rect = player_rect
+    
+    def _render_paused(self) -> None:
+        """Render the world under a semi-transparent overlay."""
+        # The overlay darkens whatever is under it, so always start clean
+        self._full_redraw = True
+        self._render_world()
+        self.screen.blit(self._pause_overlay, (0, 0))
+    
+    def _visible_ui_rects(self) -> List[pygame.Rect]:
+        """Collect screen rects of the UI elements currently on screen.
+        
+        Returns:
+            Rects of the active menu elements and visible panels
+        """
+        rects = [
+            element.rect
+            for element in self.menu_manager.elements.get(self.state, ())
+        ]
+        for panel in self._panels:
+            if panel.visible:
+                rects.append(panel.panel.rect)
+        return rects
     
     def run(self):
         """Run the main game loop."""
         logger.info("Starting game loop")
         
+        # Real time not yet consumed by fixed logic steps
+        accumulator = 0.0
+        
         while self.is_running:
-            # Calculate delta time
-            delta_time = self.clock.tick(60) / 1000.0
+            # Calculate delta time; the cap sleeps out the rest of the step,
+            # since frames with nothing dirty present nothing and so never
+            # block on the display
+            accumulator += min(self.clock.tick(TICK_RATE) / 1000.0, MAX_DELTA_TIME)
+            
+            # Sample SDL input once per frame and share it with all handlers;
+            # outside gameplay nothing moves on its own, so sleep in SDL until
+            # input arrives instead of spinning
+            if self.state == GameState.PLAYING:
+                events = _event_get()
+            else:
+                first = _event_wait(IDLE_WAIT_MS)
+                events = [] if first.type == NOEVENT else [first, *_event_get()]
+            keys = _get_pressed()
+            
+            self.handle_events(events)
+            
+            # Advance logic in fixed steps independent of the render rate
+            while accumulator >= FIXED_TIMESTEP:
+                self.update(FIXED_TIMESTEP, keys)
+                accumulator -= FIXED_TIMESTEP
             
-            self.handle_events()
-            self.update(delta_time)
             self.render()
         
         logger.info("Game loop ended")
@@ -3,6 +3,8 @@
 This module handles the player character and its interactions.
 """
 
+from typing import Callable, Optional, Sequence
+
 import pygame
 from pygame.math import Vector2
 
@@ -18,9 +20,60 @@ from client.sprites import SpriteManager, Direction, AnimationState
 
 logger = get_logger(__name__)
 
+# Movement bits packed by the game loop from the keyboard state
+MOVE_UP = 1 << 0
+MOVE_DOWN = 1 << 1
+MOVE_LEFT = 1 << 2
+MOVE_RIGHT = 1 << 3
+
+# Per-axis scale for diagonal movement (1 / sqrt(2))
+DIAGONAL_SCALE = 0.7071067811865476
+
+# Offset from the player's centre to its top-left corner
+_HALF_SIZE = PLAYER_SIZE // 2
+
+def _build_move_table() -> tuple:
+    """Precompute (vx, vy, facing, animation state) for every movement mask.
+    
+    Up wins over down and left over right; horizontal movement decides
+    the facing direction, as with the original per-key checks.
+    
+    Returns:
+        Tuple indexed by movement mask
+    """
+    table = []
+    for mask in range(16):
+        dx = -1 if mask & MOVE_LEFT else 1 if mask & MOVE_RIGHT else 0
+        dy = -1 if mask & MOVE_UP else 1 if mask & MOVE_DOWN else 0
+        speed = PLAYER_SPEED * (DIAGONAL_SCALE if dx and dy else 1.0)
+        
+        if dx:
+            facing = Direction.LEFT if dx < 0 else Direction.RIGHT
+        elif dy:
+            facing = Direction.UP if dy < 0 else Direction.DOWN
+        else:
+            facing = None
+        
+        state = AnimationState.WALKING if dx or dy else AnimationState.IDLE
+        table.append((dx * speed, dy * speed, facing, state))
+    return tuple(table)
+
+_MOVE_TABLE = _build_move_table()
+
 class Player:
     """Player class representing the user's character."""
     
+    __slots__ = (
+        "name",
+        "money",
+        "_px",
+        "_py",
+        "_vx",
+        "_vy",
+        "sprite_manager",
+        "rect"
+    )
+    
     def __init__(self, position: Vector2, name: str = "Player"):
         """Initialize the player.
         
@@ -29,77 +82,125 @@ class Player:
             name: Player name
         """
         self.name = name
-        self.position = position
-        self.velocity = Vector2(0, 0)
         self.money = STARTING_MONEY
         
+        # Position and velocity as plain floats; Vector2 views are built on demand
+        self._px = float(position.x)
+        self._py = float(position.y)
+        self._vx = 0.0
+        self._vy = 0.0
+        
         # Create sprite manager
         self.sprite_manager = SpriteManager()
         
         # Create collision rect
-        self.rect = pygame.Rect(0, 0, PLAYER_SIZE, PLAYER_SIZE)
-        self.rect.center = self.position
+        self.rect = pygame.Rect(
+            int(self._px) - _HALF_SIZE,
+            int(self._py) - _HALF_SIZE,
+            PLAYER_SIZE,
+            PLAYER_SIZE
+        )
         
         logger.info(f"Created player: {self.name}")
     
-    def handle_input(self, keys: pygame.key.ScancodeWrapper) -> None:
-        """Handle keyboard input.
+    @property
+    def position(self) -> Vector2:
+        """Vector2 copy of the player's world position."""
+        return Vector2(self._px, self._py)
+    
+    @position.setter
+    def position(self, value: Sequence[float]) -> None:
+        """Move the player to a world position.
         
         Args:
-            keys: Pressed keys
+            value: New (x, y) position
         """
-        # Reset velocity
-        self.velocity = Vector2(0, 0)
-        
-        # Movement
-        if keys[pygame.K_w] or keys[pygame.K_UP]:
-            self.velocity.y = -PLAYER_SPEED
-            self.sprite_manager.set_direction(Direction.UP)
-        elif keys[pygame.K_s] or keys[pygame.K_DOWN]:
-            self.velocity.y = PLAYER_SPEED
-            self.sprite_manager.set_direction(Direction.DOWN)
-        
-        if keys[pygame.K_a] or keys[pygame.K_LEFT]:
-            self.velocity.x = -PLAYER_SPEED
-            self.sprite_manager.set_direction(Direction.LEFT)
-        elif keys[pygame.K_d] or keys[pygame.K_RIGHT]:
-            self.velocity.x = PLAYER_SPEED
-            self.sprite_manager.set_direction(Direction.RIGHT)
-        
-        # Update animation state
-        if self.velocity.length() > 0:
-            self.sprite_manager.set_state(AnimationState.WALKING)
-        else:
-            self.sprite_manager.set_state(AnimationState.IDLE)
+        self._px = float(value[0])
+        self._py = float(value[1])
+        self.rect.x = int(self._px) - _HALF_SIZE
+        self.rect.y = int(self._py) - _HALF_SIZE
+    
+    @property
+    def velocity(self) -> Vector2:
+        """Vector2 copy of the player's velocity."""
+        return Vector2(self._vx, self._vy)
+    
+    @property
+    def x(self) -> float:
+        """World x coordinate of the player's center."""
+        return self._px
+    
+    @property
+    def y(self) -> float:
+        """World y coordinate of the player's center."""
+        return self._py
+    
+    @property
+    def moving(self) -> bool:
+        """Whether the player has a non-zero velocity."""
+        return bool(self._vx or self._vy)
     
-    def update(self, delta_time: float) -> None:
+    def handle_input(self, mask: int) -> None:
+        """Handle movement input.
+        
+        Args:
+            mask: Pressed directions as MOVE_* bits
+        """
+        self._vx, self._vy, facing, state = _MOVE_TABLE[mask]
+        
+        if facing is not None:
+            self.sprite_manager.set_direction(facing)
+        self.sprite_manager.set_state(state)
+    
+    def update(
+        self,
+        delta_time: float,
+        collides: Optional[Callable[[pygame.Rect], bool]] = None
+    ) -> None:
         """Update player state.
         
+        Movement is resolved one axis at a time, so a blocked axis stops
+        without cancelling the other and the player slides along walls.
+        
         Args:
             delta_time: Time elapsed since last update
+            collides: Returns True if a rect hits something solid
         """
         # Update position
-        self.position += self.velocity * delta_time
-        self.rect.center = self.position
+        if self._vx:
+            x = self._px + self._vx * delta_time
+            self.rect.x = int(x) - _HALF_SIZE
+            if collides is not None and collides(self.rect):
+                self.rect.x = int(self._px) - _HALF_SIZE
+            else:
+                self._px = x
+        if self._vy:
+            y = self._py + self._vy * delta_time
+            self.rect.y = int(y) - _HALF_SIZE
+            if collides is not None and collides(self.rect):
+                self.rect.y = int(self._py) - _HALF_SIZE
+            else:
+                self._py = y
         
         # Update sprite animation
         self.sprite_manager.update(delta_time)
     
-    def draw(self, screen: pygame.Surface, screen_pos: pygame.Vector2) -> None:
+    def draw(self, screen: pygame.Surface, screen_pos: Sequence[float]) -> None:
         """Draw the player.
         
         Args:
             screen: Surface to draw on
-            screen_pos: Position on screen (camera-relative)
+            screen_pos: (x, y) position on screen (camera-relative)
         """
+        x, y = screen_pos
         sprite = self.sprite_manager.get_current_sprite()
         if sprite:
-            screen.blit(sprite, (screen_pos.x - PLAYER_SIZE // 2, screen_pos.y - PLAYER_SIZE // 2))
+            screen.blit(sprite, (x - _HALF_SIZE, y - _HALF_SIZE))
         else:
             # Fallback to rectangle if sprite not found
             pygame.draw.rect(screen, COLOR_BLACK, pygame.Rect(
-                screen_pos.x - PLAYER_SIZE // 2,
-                screen_pos.y - PLAYER_SIZE // 2,
+                x - _HALF_SIZE,
+                y - _HALF_SIZE,
                 PLAYER_SIZE,
                 PLAYER_SIZE
             ))
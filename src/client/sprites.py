@@ -1,7 +1,7 @@
 """Sprite management system for handling game animations."""
 
-from enum import Enum, auto
-from typing import Dict, List, Optional
+from enum import Enum, IntEnum, auto
+from typing import Dict, List, Optional, Tuple
 import pygame
 from pygame.math import Vector2
 
@@ -15,34 +15,59 @@ from shared.logger import get_logger
 
 logger = get_logger(__name__)
 
-class Direction(Enum):
-    """Character facing directions."""
-    DOWN = auto()
-    LEFT = auto()
-    RIGHT = auto()
-    UP = auto()
+class Direction(IntEnum):
+    """Character facing directions; each value is its sprite sheet row."""
+    DOWN = 0
+    LEFT = 1
+    RIGHT = 2
+    UP = 3
 
 class AnimationState(Enum):
     """Character animation states."""
     IDLE = auto()
     WALKING = auto()
 
+# Animation frames per direction row
+FRAMES_PER_ROW = 4
+
+# Fill color of the generated sheet for roles without a sprite file
+_FALLBACK_COLORS: Dict[PlayerRole, Tuple[int, int, int]] = {
+    PlayerRole.MEDIATOR_RUPOK: (0, 255, 0),  # Green
+    PlayerRole.MEDIATOR_SHORON: (0, 0, 255),  # Blue
+    PlayerRole.BUSINESSMAN: (255, 215, 0),  # Gold
+    PlayerRole.MAFIA: (255, 0, 0)  # Red
+}
+
 class SpriteManager:
     """Manages character sprites and animations.
     
     Attributes:
         sprites: Dictionary of sprite sheets for each role
+        frames: Per role, the sliced frames indexed [row][frame]
+        role: Role whose sprites this character shows
+        direction: Current facing direction
+        state: Current animation state
         current_frame: Current animation frame index
-        animation_timer: Time accumulator for animation
-        frame_duration: Time between animation frames
+        animation_ms: Animation clock in whole milliseconds
+        _pending_ms: Fraction of a millisecond not yet added to the clock
+        frame_ms: Milliseconds between animation frames
     """
     
-    def __init__(self):
-        """Initialize the sprite manager."""
+    def __init__(self, role: PlayerRole = PlayerRole.BUSINESSMAN):
+        """Initialize the sprite manager.
+        
+        Args:
+            role: Role whose sprites this character shows
+        """
         self.sprites: Dict[PlayerRole, pygame.Surface] = {}
+        self.frames: Dict[PlayerRole, Tuple[Tuple[pygame.Surface, ...], ...]] = {}
+        self.role = role
+        self.direction = Direction.DOWN
+        self.state = AnimationState.IDLE
         self.current_frame = 0
-        self.animation_timer = 0
-        self.frame_duration = 1.0 / ANIMATION_FRAME_RATE
+        self.animation_ms = 0
+        self._pending_ms = 0.0
+        self.frame_ms = 1000 // ANIMATION_FRAME_RATE
         
         # Load sprite sheets for each role
         self._load_sprites()
@@ -60,6 +85,17 @@ class SpriteManager:
             try:
                 if path.exists():
                     sprite_sheet = pygame.image.load(str(path)).convert_alpha()
+                    
+                    # Frames are cut from full PLAYER_SIZE cells, so a sheet
+                    # smaller than the grid cannot be sliced
+                    min_size = (FRAMES_PER_ROW * PLAYER_SIZE, len(Direction) * PLAYER_SIZE)
+                    if (sprite_sheet.get_width() < min_size[0]
+                            or sprite_sheet.get_height() < min_size[1]):
+                        logger.warning(
+                            f"Sprite sheet for {role} is {sprite_sheet.get_size()}, "
+                            f"smaller than {min_size}; using fallback"
+                        )
+                        sprite_sheet = self._create_fallback_sprite(role)
                     self.sprites[role] = sprite_sheet
                 else:
                     logger.warning(f"Sprite file not found for {role}: {path}")
@@ -69,6 +105,31 @@ class SpriteManager:
                 logger.error(f"Error loading sprite for {role}: {e}")
                 fallback = self._create_fallback_sprite(role)
                 self.sprites[role] = fallback
+            
+            self.frames[role] = self._slice_frames(self.sprites[role])
+    
+    def _slice_frames(self, sheet: pygame.Surface) -> Tuple[Tuple[pygame.Surface, ...], ...]:
+        """Cut a sprite sheet into display-ready animation frames.
+        
+        Args:
+            sheet: Sprite sheet with one row per direction, already in the
+                display format
+            
+        Returns:
+            Frames indexed [direction row][frame]
+        """
+        return tuple(
+            tuple(
+                sheet.subsurface(pygame.Rect(
+                    frame * PLAYER_SIZE,
+                    row * PLAYER_SIZE,
+                    PLAYER_SIZE,
+                    PLAYER_SIZE
+                )).copy()
+                for frame in range(FRAMES_PER_ROW)
+            )
+            for row in range(len(Direction))
+        )
     
     def _create_fallback_sprite(self, role: PlayerRole) -> pygame.Surface:
         """Create a fallback sprite when image loading fails.
@@ -79,16 +140,10 @@ class SpriteManager:
         Returns:
             Surface with role-specific color
         """
-        colors = {
-            PlayerRole.MEDIATOR_RUPOK: (0, 255, 0),  # Green
-            PlayerRole.MEDIATOR_SHORON: (0, 0, 255),  # Blue
-            PlayerRole.BUSINESSMAN: (255, 215, 0),  # Gold
-            PlayerRole.MAFIA: (255, 0, 0)  # Red
-        }
-        
-        # Create surface for sprite sheet (4 directions x 4 frames)
-        surface = pygame.Surface((PLAYER_SIZE * 4, PLAYER_SIZE * 4), pygame.SRCALPHA)
-        color = colors.get(role, (128, 128, 128))  # Gray as default
+        # Create surface for sprite sheet (4 directions x 4 frames); every
+        # frame is a solid rectangle, so no per-pixel alpha is needed
+        surface = pygame.Surface((PLAYER_SIZE * 4, PLAYER_SIZE * 4))
+        color = _FALLBACK_COLORS.get(role, (128, 128, 128))  # Gray as default
         
         # Draw colored rectangles for each frame
         for y in range(4):  # 4 directions
@@ -101,14 +156,51 @@ class SpriteManager:
                 )
                 pygame.draw.rect(surface, color, rect)
         
+        # Match the display format like the loaded sheets do
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()
         return surface
     
+    def set_direction(self, direction: Direction) -> None:
+        """Set the facing direction.
+        
+        Args:
+            direction: New facing direction
+        """
+        self.direction = direction
+    
+    def set_state(self, state: AnimationState) -> None:
+        """Set the animation state.
+        
+        Args:
+            state: New animation state
+        """
+        self.state = state
+    
+    def update(self, delta_time: float) -> None:
+        """Advance the animation once per tick.
+        
+        Args:
+            delta_time: Time elapsed since last update
+        """
+        # Advance the integer animation clock by whole milliseconds, carrying
+        # the remainder so fractional steps do not drift
+        self._pending_ms += delta_time * 1000
+        elapsed = int(self._pending_ms)
+        self._pending_ms -= elapsed
+        self.animation_ms += elapsed
+        
+        # If idle, use first frame
+        if self.state == AnimationState.IDLE:
+            self.current_frame = 0
+        else:
+            self.current_frame = (self.animation_ms // self.frame_ms) % FRAMES_PER_ROW
+    
     def get_sprite_frame(
         self,
         role: PlayerRole,
         direction: Direction,
-        state: AnimationState,
-        delta_time: float
+        state: AnimationState
     ) -> pygame.Surface:
         """Get the current sprite frame for a character.
         
@@ -116,40 +208,17 @@ class SpriteManager:
             role: Character's role
             direction: Facing direction
             state: Current animation state
-            delta_time: Time elapsed since last frame
             
         Returns:
             Current frame of the sprite animation
         """
-        sprite_sheet = self.sprites[role]
-        
-        # Update animation timer
-        self.animation_timer += delta_time
-        if self.animation_timer >= self.frame_duration:
-            self.animation_timer -= self.frame_duration
-            self.current_frame = (self.current_frame + 1) % 4
-        
-        # Calculate frame position in sprite sheet
-        direction_row = {
-            Direction.DOWN: 0,
-            Direction.LEFT: 1,
-            Direction.RIGHT: 2,
-            Direction.UP: 3
-        }[direction]
-        
-        # If idle, use first frame
-        if state == AnimationState.IDLE:
-            self.current_frame = 0
-        
-        # Extract frame from sprite sheet
-        frame_rect = pygame.Rect(
-            self.current_frame * PLAYER_SIZE,
-            direction_row * PLAYER_SIZE,
-            PLAYER_SIZE,
-            PLAYER_SIZE
-        )
-        
-        frame = pygame.Surface((PLAYER_SIZE, PLAYER_SIZE), pygame.SRCALPHA)
-        frame.blit(sprite_sheet, (0, 0), frame_rect)
+        frame = 0 if state == AnimationState.IDLE else self.current_frame
+        return self.frames[role][direction][frame]
+    
+    def get_current_sprite(self) -> pygame.Surface:
+        """Get the frame for this character's own role, direction and state.
         
-        return frame 
\ No newline at end of file
+        Returns:
+            Current frame of the sprite animation
+        """
+        return self.frames[self.role][self.direction][self.current_frame] 
\ No newline at end of file
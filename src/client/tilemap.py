@@ -6,12 +6,14 @@ This module handles the office environment's tile-based map system.
 from dataclasses import dataclass
 from enum import Enum, auto
 from typing import Dict, List, Optional, Tuple
+import numpy as np
 import pygame
 
 from shared.constants import (
     TILE_SIZE,
     MAP_WIDTH,
     MAP_HEIGHT,
+    CHUNK_TILES,
     COLOR_WHITE,
     COLOR_BLACK,
     COLOR_GRAY
@@ -33,7 +35,20 @@ class TileType(Enum):
     MEETING_TABLE = auto()
     WATER_COOLER = auto()
 
-@dataclass
+# Tile types that block movement
+COLLIDABLE_TILES = frozenset({
+    TileType.WALL,
+    TileType.DESK,
+    TileType.MEETING_TABLE,
+    TileType.CABINET
+})
+
+# Whether each TileType value blocks movement, for mapping whole grids of
+# tile codes at once; scalar checks use COLLIDABLE_TILES
+_COLLIDABLE_MASK = np.zeros(max(t.value for t in TileType) + 1, dtype=np.bool_)
+_COLLIDABLE_MASK[[t.value for t in COLLIDABLE_TILES]] = True
+
+@dataclass(slots=True)
 class Room:
     """Room in the office environment."""
     name: str
@@ -43,9 +58,50 @@ class Room:
     height: int
     room_type: str
 
+# Default fill color per tile type, as RGB rows indexed by TileType value;
+# row 0 is the background of cells with no tile
+_TILE_COLORS = np.zeros((max(t.value for t in TileType) + 1, 3), dtype=np.uint8)
+_TILE_COLORS[0] = COLOR_WHITE
+_TILE_COLORS[TileType.FLOOR.value] = (240, 240, 240)  # Light gray
+_TILE_COLORS[TileType.WALL.value] = (100, 100, 100)  # Dark gray
+_TILE_COLORS[TileType.DOOR.value] = (150, 75, 0)  # Brown
+_TILE_COLORS[TileType.DESK.value] = (160, 110, 60)  # Light brown
+_TILE_COLORS[TileType.CHAIR.value] = (80, 80, 80)  # Dark gray
+_TILE_COLORS[TileType.PLANT.value] = (0, 150, 0)  # Green
+_TILE_COLORS[TileType.WINDOW.value] = (200, 230, 255)  # Light blue
+_TILE_COLORS[TileType.CABINET.value] = (120, 80, 40)  # Dark brown
+_TILE_COLORS[TileType.MEETING_TABLE.value] = (180, 130, 80)  # Medium brown
+_TILE_COLORS[TileType.WATER_COOLER.value] = (0, 150, 200)  # Blue
+
+# Default colored tile surfaces, built on first use per tile type
+_DEFAULT_TILE_SURFACES: Dict[TileType, pygame.Surface] = {}
+
+def _default_tile_surface(type: TileType) -> pygame.Surface:
+    """Get the shared default surface for a tile type.
+    
+    Args:
+        type: Type of tile
+    
+    Returns:
+        TILE_SIZE square filled with the type's default color
+    """
+    surface = _DEFAULT_TILE_SURFACES.get(type)
+    if surface is not None:
+        return surface
+    
+    surface = pygame.Surface((TILE_SIZE, TILE_SIZE))
+    if pygame.display.get_surface() is not None:
+        surface = surface.convert()
+    surface.fill(_TILE_COLORS[type.value].tolist())
+    
+    _DEFAULT_TILE_SURFACES[type] = surface
+    return surface
+
 class Tile:
     """Single tile in the map."""
     
+    __slots__ = ("type", "position", "sprite", "is_collidable")
+    
     def __init__(self, type: TileType, position: Tuple[int, int]):
         """Initialize a tile.
         
@@ -56,34 +112,10 @@ class Tile:
         self.type = type
         self.position = position
         self.sprite: Optional[pygame.Surface] = None
-        self.is_collidable = type in {TileType.WALL, TileType.DESK, TileType.MEETING_TABLE, TileType.CABINET}
+        self.is_collidable = type in COLLIDABLE_TILES
         
-        # Create default colored rectangle
-        self.sprite = pygame.Surface((TILE_SIZE, TILE_SIZE))
-        self._set_default_color()
-    
-    def _set_default_color(self) -> None:
-        """Set the default color based on tile type."""
-        if self.type == TileType.FLOOR:
-            self.sprite.fill((240, 240, 240))  # Light gray
-        elif self.type == TileType.WALL:
-            self.sprite.fill((100, 100, 100))  # Dark gray
-        elif self.type == TileType.DOOR:
-            self.sprite.fill((150, 75, 0))  # Brown
-        elif self.type == TileType.DESK:
-            self.sprite.fill((160, 110, 60))  # Light brown
-        elif self.type == TileType.CHAIR:
-            self.sprite.fill((80, 80, 80))  # Dark gray
-        elif self.type == TileType.PLANT:
-            self.sprite.fill((0, 150, 0))  # Green
-        elif self.type == TileType.WINDOW:
-            self.sprite.fill((200, 230, 255))  # Light blue
-        elif self.type == TileType.CABINET:
-            self.sprite.fill((120, 80, 40))  # Dark brown
-        elif self.type == TileType.MEETING_TABLE:
-            self.sprite.fill((180, 130, 80))  # Medium brown
-        elif self.type == TileType.WATER_COOLER:
-            self.sprite.fill((0, 150, 200))  # Blue
+        # Share one default colored rectangle per tile type
+        self.sprite = _default_tile_surface(type)
     
     def draw(self, screen: pygame.Surface, camera_offset: Tuple[int, int] = (0, 0)) -> None:
         """Draw the tile.
@@ -109,9 +141,31 @@ class TileMap:
         """
         self.width = width
         self.height = height
-        self.tiles: List[List[Optional[Tile]]] = [[None] * height for _ in range(width)]
         self.rooms: List[Room] = []
         
+        # Tiles are stored as parallel per-cell arrays indexed [y, x]: the
+        # TileType value (0 for no tile) and whether the cell blocks movement
+        self._types = np.zeros((height, width), dtype=np.uint8)
+        self._solid = np.zeros((height, width), dtype=np.bool_)
+        
+        # Summed-area table of _solid as nested lists, rebuilt lazily after
+        # solidity changes; entry [y][x] counts solid cells above and left
+        self._solid_sat: Optional[List[List[int]]] = None
+        
+        # Pre-rendered CHUNK_TILES x CHUNK_TILES blocks of tiles, baked on
+        # first draw and dropped whenever one of their tiles changes
+        self._chunks: Dict[Tuple[int, int], pygame.Surface] = {}
+        self._chunk_cols = -(-width // CHUNK_TILES)
+        self._chunk_rows = -(-height // CHUNK_TILES)
+        
+        # Blit sequence of the last full-view draw and the camera/view it
+        # was built for; reused while neither changes
+        self._view_key: Optional[Tuple[int, int, int, int]] = None
+        self._view_blits: list = []
+        
+        # Room covering each tile, filled in as rooms are added
+        self._room_at_tile: Dict[Tuple[int, int], Room] = {}
+        
         logger.info(f"Created tilemap: {width}x{height} tiles")
     
     def set_tile(self, x: int, y: int, type: TileType) -> None:
@@ -123,7 +177,34 @@ class TileMap:
             type: Tile type
         """
         if 0 <= x < self.width and 0 <= y < self.height:
-            self.tiles[x][y] = Tile(type, (x, y))
+            self._types[y, x] = type.value
+            solid = type in COLLIDABLE_TILES
+            if self._solid[y, x] != solid:
+                self._solid[y, x] = solid
+                self._solid_sat = None
+            self._chunks.pop((x // CHUNK_TILES, y // CHUNK_TILES), None)
+            self._view_key = None
+    
+    def set_types(self, types: np.ndarray) -> None:
+        """Replace every tile of the map at once.
+        
+        Args:
+            types: Array of shape (height, width) holding the TileType value
+                of each cell, indexed [y, x], or 0 for no tile
+        
+        Raises:
+            ValueError: If the array does not match the map size
+        """
+        if types.shape != (self.height, self.width):
+            raise ValueError(
+                f"Expected tile array of shape {(self.height, self.width)}, got {types.shape}"
+            )
+        
+        self._types[:] = types
+        self._solid = _COLLIDABLE_MASK[self._types]
+        self._solid_sat = None
+        self._chunks.clear()
+        self._view_key = None
     
     def get_tile(self, x: int, y: int) -> Optional[Tile]:
         """Get the tile at the given position.
@@ -133,10 +214,13 @@ class TileMap:
             y: Y coordinate
         
         Returns:
-            Tile at position or None if out of bounds
+            A new Tile built from the map's arrays, or None if the cell is
+            empty or out of bounds
         """
         if 0 <= x < self.width and 0 <= y < self.height:
-            return self.tiles[x][y]
+            code = self._types[y, x]
+            if code:
+                return Tile(TileType(code), (x, y))
         return None
     
     def add_room(self, name: str, x: int, y: int, width: int, height: int, room_type: str) -> None:
@@ -152,6 +236,11 @@ class TileMap:
         """
         room = Room(name, x, y, width, height, room_type)
         self.rooms.append(room)
+        
+        # Earlier rooms keep tiles where rooms overlap
+        for tile_x in range(x, x + width):
+            for tile_y in range(y, y + height):
+                self._room_at_tile.setdefault((tile_x, tile_y), room)
         logger.debug(f"Added room: {name} ({room_type})")
     
     def get_room_at(self, position: pygame.Vector2) -> Optional[Room]:
@@ -163,14 +252,19 @@ class TileMap:
         Returns:
             Room at position or None if not in a room
         """
-        tile_x = int(position.x / TILE_SIZE)
-        tile_y = int(position.y / TILE_SIZE)
+        return self.get_room_at_tile(int(position.x // TILE_SIZE), int(position.y // TILE_SIZE))
+    
+    def get_room_at_tile(self, tile_x: int, tile_y: int) -> Optional[Room]:
+        """Get the room containing the given tile.
         
-        for room in self.rooms:
-            if (room.x <= tile_x < room.x + room.width and 
-                room.y <= tile_y < room.y + room.height):
-                return room
-        return None
+        Args:
+            tile_x: X coordinate in tiles
+            tile_y: Y coordinate in tiles
+        
+        Returns:
+            Room at the tile or None if not in a room
+        """
+        return self._room_at_tile.get((tile_x, tile_y))
     
     def check_collision(self, rect: pygame.Rect) -> bool:
         """Check if a rectangle collides with any collidable tiles.
@@ -181,26 +275,32 @@ class TileMap:
         Returns:
             True if collision detected
         """
-        # Convert rect to tile coordinates
-        start_x = max(0, int(rect.left / TILE_SIZE))
-        end_x = min(self.width - 1, int(rect.right / TILE_SIZE))
-        start_y = max(0, int(rect.top / TILE_SIZE))
-        end_y = min(self.height - 1, int(rect.bottom / TILE_SIZE))
-        
-        # Check each tile in the rect's area
-        for x in range(start_x, end_x + 1):
-            for y in range(start_y, end_y + 1):
-                tile = self.tiles[x][y]
-                if tile and tile.is_collidable:
-                    tile_rect = pygame.Rect(
-                        x * TILE_SIZE,
-                        y * TILE_SIZE,
-                        TILE_SIZE,
-                        TILE_SIZE
-                    )
-                    if rect.colliderect(tile_rect):
-                        return True
-        return False
+        # Convert rect to the half-open tile range it overlaps
+        start_x = max(0, rect.left // TILE_SIZE)
+        end_x = min(self.width, (rect.right - 1) // TILE_SIZE + 1)
+        start_y = max(0, rect.top // TILE_SIZE)
+        end_y = min(self.height, (rect.bottom - 1) // TILE_SIZE + 1)
+        if end_x <= start_x or end_y <= start_y:
+            return False
+        
+        # Count solid tiles in the block from four summed-area lookups
+        sat = self._solid_sat
+        if sat is None:
+            sat = self._solid_sat = self._build_solid_sat()
+        top = sat[start_y]
+        bottom = sat[end_y]
+        return bottom[end_x] - bottom[start_x] - top[end_x] + top[start_x] > 0
+    
+    def _build_solid_sat(self) -> List[List[int]]:
+        """Build the summed-area table of the solidity mask.
+        
+        Returns:
+            (height + 1) x (width + 1) prefix sums as nested lists, which
+            index faster than NumPy scalars for single lookups
+        """
+        sat = np.zeros((self.height + 1, self.width + 1), dtype=np.int32)
+        sat[1:, 1:] = self._solid.cumsum(axis=0).cumsum(axis=1)
+        return sat.tolist()
     
     def draw(self, screen: pygame.Surface, camera_offset: Tuple[int, int] = (0, 0)) -> None:
         """Draw the tilemap.
@@ -209,17 +309,116 @@ class TileMap:
             screen: Surface to draw on
             camera_offset: Camera offset (x, y)
         """
-        # Only draw tiles that are visible on screen
-        start_x = max(0, int(camera_offset[0] / TILE_SIZE))
-        end_x = min(self.width, int((camera_offset[0] + screen.get_width()) / TILE_SIZE) + 1)
-        start_y = max(0, int(camera_offset[1] / TILE_SIZE))
-        end_y = min(self.height, int((camera_offset[1] + screen.get_height()) / TILE_SIZE) + 1)
-        
-        for x in range(start_x, end_x):
-            for y in range(start_y, end_y):
-                tile = self.tiles[x][y]
-                if tile:
-                    tile.draw(screen, camera_offset)
+        # A still camera sees the same chunks at the same spots
+        key = (camera_offset[0], camera_offset[1], screen.get_width(), screen.get_height())
+        if key != self._view_key:
+            self._view_blits = self._area_blits(screen, camera_offset, screen.get_rect())
+            self._view_key = key
+        screen.blits(self._view_blits, doreturn=0)
+    
+    def draw_area(
+        self,
+        screen: pygame.Surface,
+        camera_offset: Tuple[int, int],
+        area: pygame.Rect
+    ) -> None:
+        """Draw only the tiles under a rect of the screen.
+        
+        Args:
+            screen: Surface to draw on
+            camera_offset: Camera offset (x, y)
+            area: Screen-space rect to repaint
+        """
+        screen.blits(self._area_blits(screen, camera_offset, area), doreturn=0)
+    
+    def _area_blits(
+        self,
+        screen: pygame.Surface,
+        camera_offset: Tuple[int, int],
+        area: pygame.Rect
+    ) -> list:
+        """Build the chunk blits that cover a rect of the screen.
+        
+        Args:
+            screen: Surface that will be drawn on
+            camera_offset: Camera offset (x, y)
+            area: Screen-space rect to cover
+        
+        Returns:
+            (chunk, destination, source area) tuples for Surface.blits
+        """
+        # Only draw chunks that overlap the area
+        chunk_px = CHUNK_TILES * TILE_SIZE
+        cam_x, cam_y = camera_offset
+        world = area.clip(screen.get_rect()).move(cam_x, cam_y)
+        start_x = max(0, world.left // chunk_px)
+        end_x = min(self._chunk_cols, (world.right - 1) // chunk_px + 1)
+        start_y = max(0, world.top // chunk_px)
+        end_y = min(self._chunk_rows, (world.bottom - 1) // chunk_px + 1)
+        
+        chunks = self._chunks
+        blits = []
+        for cx in range(start_x, end_x):
+            for cy in range(start_y, end_y):
+                chunk = chunks.get((cx, cy))
+                if chunk is None:
+                    chunk = chunks[(cx, cy)] = self._bake_chunk(cx, cy)
+                
+                # Copy just the part of the chunk inside the area
+                chunk_x = cx * chunk_px
+                chunk_y = cy * chunk_px
+                clip = world.clip((chunk_x, chunk_y, chunk_px, chunk_px))
+                blits.append((
+                    chunk,
+                    (clip.x - cam_x, clip.y - cam_y),
+                    clip.move(-chunk_x, -chunk_y)
+                ))
+        return blits
+    
+    def bake(self) -> None:
+        """Pre-render every chunk of the map in the display's pixel format.
+        
+        Call once the display exists; chunks made before then could not be
+        converted, so every chunk is re-baked here.
+        """
+        self._chunks.clear()
+        self._view_key = None
+        for cx in range(self._chunk_cols):
+            for cy in range(self._chunk_rows):
+                self._chunks[(cx, cy)] = self._bake_chunk(cx, cy)
+        logger.debug("Baked %d map chunks", len(self._chunks))
+    
+    def _bake_chunk(self, cx: int, cy: int) -> pygame.Surface:
+        """Render one chunk of tiles into its own surface.
+        
+        Args:
+            cx: Chunk X coordinate
+            cy: Chunk Y coordinate
+        
+        Returns:
+            Surface holding the chunk's tiles
+        """
+        chunk_px = CHUNK_TILES * TILE_SIZE
+        chunk = pygame.Surface((chunk_px, chunk_px))
+        if pygame.display.get_surface() is not None:
+            chunk = chunk.convert()
+        
+        # Chunks past the map edge are only partly covered by tiles; the
+        # rest shows the window background, as when drawn directly
+        chunk.fill(COLOR_WHITE)
+        
+        # Tiles are solid colors, so the chunk is the block's color table
+        # lookup scaled up by TILE_SIZE, written straight into the pixels.
+        # surfarray views are indexed [x, y], hence the transpose
+        first_x = cx * CHUNK_TILES
+        first_y = cy * CHUNK_TILES
+        block = self._types[first_y:first_y + CHUNK_TILES, first_x:first_x + CHUNK_TILES]
+        colors = _TILE_COLORS[block.T]
+        scaled = colors.repeat(TILE_SIZE, axis=0).repeat(TILE_SIZE, axis=1)
+        pixels = pygame.surfarray.pixels3d(chunk)
+        pixels[:scaled.shape[0], :scaled.shape[1]] = scaled
+        del pixels  # Unlock the surface
+        return chunk
 
 def create_test_map() -> TileMap:
     """Create a test office map.
@@ -229,78 +428,60 @@ def create_test_map() -> TileMap:
     """
     tilemap = TileMap()
     
-    # Fill with floor tiles
-    for x in range(MAP_WIDTH):
-        for y in range(MAP_HEIGHT):
-            tilemap.set_tile(x, y, TileType.FLOOR)
+    # Lay the map out as a grid of tile codes indexed [y, x], then load it
+    # in one go; later writes overwrite earlier ones
+    FLOOR = TileType.FLOOR.value
+    WALL = TileType.WALL.value
+    DOOR = TileType.DOOR.value
+    DESK = TileType.DESK.value
+    CHAIR = TileType.CHAIR.value
+    grid = np.full((MAP_HEIGHT, MAP_WIDTH), FLOOR, dtype=np.uint8)
     
     # Add outer walls
-    for x in range(MAP_WIDTH):
-        tilemap.set_tile(x, 0, TileType.WALL)
-        tilemap.set_tile(x, MAP_HEIGHT - 1, TileType.WALL)
-    for y in range(MAP_HEIGHT):
-        tilemap.set_tile(0, y, TileType.WALL)
-        tilemap.set_tile(MAP_WIDTH - 1, y, TileType.WALL)
+    grid[0, :] = grid[-1, :] = WALL
+    grid[:, 0] = grid[:, -1] = WALL
     
     # Add reception area
     tilemap.add_room("Reception", 2, 2, 8, 6, "reception")
-    for x in range(2, 10):
-        tilemap.set_tile(x, 2, TileType.WALL)
-        tilemap.set_tile(x, 7, TileType.WALL)
-    for y in range(2, 8):
-        tilemap.set_tile(2, y, TileType.WALL)
-        tilemap.set_tile(9, y, TileType.WALL)
-    tilemap.set_tile(5, 2, TileType.DOOR)
-    tilemap.set_tile(4, 4, TileType.DESK)
-    tilemap.set_tile(4, 5, TileType.CHAIR)
+    grid[2, 2:10] = grid[7, 2:10] = WALL
+    grid[2:8, 2] = grid[2:8, 9] = WALL
+    grid[2, 5] = DOOR
+    grid[4, 4] = DESK
+    grid[5, 4] = CHAIR
     
     # Add meeting room
     tilemap.add_room("Meeting Room", 12, 2, 10, 8, "meeting")
-    for x in range(12, 22):
-        tilemap.set_tile(x, 2, TileType.WALL)
-        tilemap.set_tile(x, 9, TileType.WALL)
-    for y in range(2, 10):
-        tilemap.set_tile(12, y, TileType.WALL)
-        tilemap.set_tile(21, y, TileType.WALL)
-    tilemap.set_tile(12, 5, TileType.DOOR)
-    for x in range(14, 20, 2):
-        tilemap.set_tile(x, 4, TileType.MEETING_TABLE)
-        tilemap.set_tile(x, 7, TileType.CHAIR)
+    grid[2, 12:22] = grid[9, 12:22] = WALL
+    grid[2:10, 12] = grid[2:10, 21] = WALL
+    grid[5, 12] = DOOR
+    grid[4, 14:20:2] = TileType.MEETING_TABLE.value
+    grid[7, 14:20:2] = CHAIR
     
     # Add offices
     for i in range(3):
         x = 2 + i * 8
         tilemap.add_room(f"Office {i+1}", x, 12, 6, 6, "office")
-        for dx in range(6):
-            tilemap.set_tile(x + dx, 12, TileType.WALL)
-            tilemap.set_tile(x + dx, 17, TileType.WALL)
-        for dy in range(6):
-            tilemap.set_tile(x, 12 + dy, TileType.WALL)
-            tilemap.set_tile(x + 5, 12 + dy, TileType.WALL)
-        tilemap.set_tile(x + 2, 12, TileType.DOOR)
-        tilemap.set_tile(x + 2, 14, TileType.DESK)
-        tilemap.set_tile(x + 2, 15, TileType.CHAIR)
-        tilemap.set_tile(x + 4, 14, TileType.CABINET)
+        grid[12, x:x + 6] = grid[17, x:x + 6] = WALL
+        grid[12:18, x] = grid[12:18, x + 5] = WALL
+        grid[12, x + 2] = DOOR
+        grid[14, x + 2] = DESK
+        grid[15, x + 2] = CHAIR
+        grid[14, x + 4] = TileType.CABINET.value
     
     # Add break room
     tilemap.add_room("Break Room", 28, 12, 8, 8, "break")
-    for x in range(28, 36):
-        tilemap.set_tile(x, 12, TileType.WALL)
-        tilemap.set_tile(x, 19, TileType.WALL)
-    for y in range(12, 20):
-        tilemap.set_tile(28, y, TileType.WALL)
-        tilemap.set_tile(35, y, TileType.WALL)
-    tilemap.set_tile(28, 15, TileType.DOOR)
-    tilemap.set_tile(30, 14, TileType.DESK)
-    tilemap.set_tile(33, 14, TileType.WATER_COOLER)
-    for x in range(30, 34, 2):
-        tilemap.set_tile(x, 17, TileType.CHAIR)
+    grid[12, 28:36] = grid[19, 28:36] = WALL
+    grid[12:20, 28] = grid[12:20, 35] = WALL
+    grid[15, 28] = DOOR
+    grid[14, 30] = DESK
+    grid[14, 33] = TileType.WATER_COOLER.value
+    grid[17, 30:34:2] = CHAIR
     
     # Add some decoration
-    for x in range(2, MAP_WIDTH - 2, 6):
-        tilemap.set_tile(x, 9, TileType.PLANT)
-    for y in range(2, MAP_HEIGHT - 2, 6):
-        tilemap.set_tile(25, y, TileType.WINDOW)
+    grid[9, 2:MAP_WIDTH - 2:6] = TileType.PLANT.value
+    grid[2:MAP_HEIGHT - 2:6, 25] = TileType.WINDOW.value
+    
+    tilemap.set_types(grid)
     
     logger.info("Created test office map")
     return tilemap 
\ No newline at end of file
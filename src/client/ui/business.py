@@ -5,6 +5,7 @@ This module handles the display of business information and interactions.
 
 import pygame
 import pygame_gui
+from pygame_gui import UI_BUTTON_PRESSED
 from pygame_gui.elements import (
     UIPanel,
     UILabel,
@@ -118,6 +119,11 @@ class BusinessPanel:
             container=self.panel
         )
         
+        # Row labels reused across refreshes
+        self._resource_labels: list[UILabel] = []
+        self._contract_labels: list[UILabel] = []
+        self._conflict_labels: list[UILabel] = []
+        
         # Hide panel initially
         self.hide()
     
@@ -128,6 +134,7 @@ class BusinessPanel:
             business: Business to display
         """
         self.current_business = business
+        business.dirty = True
         self.update_display()
         self.panel.show()
         self.visible = True
@@ -139,10 +146,15 @@ class BusinessPanel:
         self.visible = False
         self.current_business = None
     
-    def update_display(self) -> None:
-        """Update all displayed information."""
-        if not self.current_business:
-            return
+    def update_display(self) -> bool:
+        """Update all displayed information if the business changed.
+        
+        Returns:
+            bool: True if the panel contents were refreshed
+        """
+        if not self.current_business or not self.current_business.dirty:
+            return False
+        self.current_business.dirty = False
         
         # Update basic info
         self.name_label.set_text(self.current_business.name)
@@ -153,37 +165,57 @@ class BusinessPanel:
         self._update_resources()
         self._update_contracts()
         self._update_conflicts()
+        return True
     
-    def _update_resources(self) -> None:
-        """Update the resources display."""
-        # Clear existing elements
-        for element in self.resources_container.elements():
-            element.kill()
-        
-        # Add resource entries
-        y_offset = 0
-        for resource in self.current_business.resources.values():
-            # Resource name and quantity
-            text = f"{resource.name}: {resource.quantity:,} @ ${resource.value:,.2f}/unit"
-            label = UILabel(
-                relative_rect=pygame.Rect((0, y_offset), (360, 30)),
-                text=text,
-                manager=self.ui_manager,
-                container=self.resources_container
-            )
-            y_offset += 35
+    def _sync_rows(
+        self,
+        container: UIScrollingContainer,
+        labels: list[UILabel],
+        texts: list[str],
+        min_height: int
+    ) -> None:
+        """Update a container's row labels in place.
+        
+        Existing labels are retitled, missing rows are created and surplus
+        rows are killed, so only a change in row count touches the layout.
+        
+        Args:
+            container: Scrolling container holding the rows
+            labels: Persistent label list for the container
+            texts: Text for each row, in display order
+            min_height: Minimum scrollable area height
+        """
+        old_count = len(labels)
+        for i, text in enumerate(texts):
+            if i < old_count:
+                labels[i].set_text(text)
+            else:
+                labels.append(UILabel(
+                    relative_rect=pygame.Rect((0, i * 35), (360, 30)),
+                    text=text,
+                    manager=self.ui_manager,
+                    container=container
+                ))
+        
+        for label in labels[len(texts):]:
+            label.kill()
+        del labels[len(texts):]
         
         # Update container height
-        self.resources_container.set_scrollable_area_height(max(120, y_offset))
+        if len(labels) != old_count:
+            container.set_scrollable_area_height(max(min_height, len(labels) * 35))
+    
+    def _update_resources(self) -> None:
+        """Update the resources display."""
+        texts = [
+            f"{resource.name}: {resource.quantity:,} @ ${resource.value:,.2f}/unit"
+            for resource in self.current_business.resources.values()
+        ]
+        self._sync_rows(self.resources_container, self._resource_labels, texts, 120)
     
     def _update_contracts(self) -> None:
         """Update the contracts display."""
-        # Clear existing elements
-        for element in self.contracts_container.elements():
-            element.kill()
-        
-        # Add contract entries
-        y_offset = 0
+        texts = []
         for contract in self.current_business.contracts:
             # Contract details
             if contract.seller == self.current_business:
@@ -193,43 +225,23 @@ class BusinessPanel:
             
             if contract.is_fulfilled:
                 text += " (Fulfilled)"
-            
-            label = UILabel(
-                relative_rect=pygame.Rect((0, y_offset), (360, 30)),
-                text=text,
-                manager=self.ui_manager,
-                container=self.contracts_container
-            )
-            y_offset += 35
+            texts.append(text)
         
-        # Update container height
-        self.contracts_container.set_scrollable_area_height(max(120, y_offset))
+        self._sync_rows(self.contracts_container, self._contract_labels, texts, 120)
     
     def _update_conflicts(self) -> None:
         """Update the conflicts display."""
-        # Clear existing elements
-        for element in self.conflicts_container.elements():
-            element.kill()
-        
-        # Add conflict entries
-        y_offset = 0
-        for conflict in self.current_business.conflicts:
+        # Conflicts are held in a set; list them in creation order
+        texts = []
+        for conflict in sorted(self.current_business.conflicts, key=lambda c: c.id):
             if not conflict.is_resolved:
                 # Conflict details
                 text = f"{conflict.type.value}"
                 if conflict.mediator:
                     text += f" - Mediator: {conflict.mediator}"
-                
-                label = UILabel(
-                    relative_rect=pygame.Rect((0, y_offset), (360, 30)),
-                    text=text,
-                    manager=self.ui_manager,
-                    container=self.conflicts_container
-                )
-                y_offset += 35
+                texts.append(text)
         
-        # Update container height
-        self.conflicts_container.set_scrollable_area_height(max(80, y_offset))
+        self._sync_rows(self.conflicts_container, self._conflict_labels, texts, 80)
     
     def handle_event(self, event: pygame.event.Event) -> None:
         """Handle UI events.
@@ -237,7 +249,7 @@ class BusinessPanel:
         Args:
             event: The event to handle
         """
-        if event.type == pygame_gui.UI_BUTTON_PRESSED:
+        if event.type == UI_BUTTON_PRESSED:
             if event.ui_element in self.panel.elements:
                 logger.debug(f"Business panel button pressed: {event.ui_element.text}")
                 # Handle button presses here 
\ No newline at end of file
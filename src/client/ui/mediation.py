@@ -5,6 +5,7 @@ This module handles the conflict resolution interface.
 
 import pygame
 import pygame_gui
+from pygame_gui import UI_BUTTON_PRESSED, UI_DROP_DOWN_MENU_CHANGED
 from pygame_gui.elements import (
     UIPanel,
     UILabel,
@@ -19,7 +20,8 @@ from shared.constants import (
     WINDOW_HEIGHT,
     MEDIATION_FEE_MIN,
     MEDIATION_FEE_MAX,
-    ResolutionMethod
+    ResolutionMethod,
+    RESOLUTION_METHOD_VALUES
 )
 from shared.logger import get_logger
 from client.business import Business, Conflict
@@ -93,7 +95,7 @@ class MediationPanel:
         )
         
         self.resolution_dropdown = UIDropDownMenu(
-            options_list=[method.value for method in ResolutionMethod],
+            options_list=list(RESOLUTION_METHOD_VALUES),
             starting_option=ResolutionMethod.MEDIATION.value,
             relative_rect=pygame.Rect((310, 200), (280, 30)),
             manager=ui_manager,
@@ -172,7 +174,7 @@ class MediationPanel:
         # Update parties info
         parties_text = "<br>".join(
             f"<b>{party.name}</b> ({party.type.value})"
-            for party in conflict.parties
+            for party in sorted(conflict.parties, key=lambda p: p.name)
         )
         self.parties_info.html_text = parties_text
         self.parties_info.rebuild()
@@ -203,13 +205,13 @@ class MediationPanel:
         if not self.visible:
             return
         
-        if event.type == pygame_gui.UI_BUTTON_PRESSED:
+        if event.type == UI_BUTTON_PRESSED:
             if event.ui_element == self.cancel_button:
                 self.hide()
             elif event.ui_element == self.resolve_button:
                 self._resolve_conflict()
         
-        elif event.type == pygame_gui.UI_DROP_DOWN_MENU_CHANGED:
+        elif event.type == UI_DROP_DOWN_MENU_CHANGED:
             if event.ui_element == self.resolution_dropdown:
                 self._update_fee_visibility()
     
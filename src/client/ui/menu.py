@@ -3,8 +3,12 @@
 This module handles the main menu, pause menu, and other UI screens.
 """
 
+from functools import partial
+from typing import Callable, Dict, Optional, Tuple
 import pygame
 import pygame_gui
+from pygame_gui import UI_BUTTON_PRESSED
+from pygame_gui.core import UIElement
 from pygame_gui.elements import UIButton, UILabel, UIDropDownMenu
 from pygame_gui.windows import UIMessageWindow
 
@@ -14,7 +18,8 @@ from shared.constants import (
     UI_FONT,
     UI_FONT_SIZE,
     GameState,
-    PlayerRole
+    PlayerRole,
+    PLAYER_ROLE_VALUES
 )
 from shared.logger import get_logger
 
@@ -27,11 +32,20 @@ class MenuManager:
         """Initialize the menu manager."""
         self.ui_manager = ui_manager
         self.current_state = GameState.MENU
-        self.elements = {
-            GameState.MENU: [],
-            GameState.PLAYING: [],
-            GameState.PAUSED: []
-        }
+        
+        # State whose elements are on screen; None until the first
+        # show_state, while every element is still visible from creation
+        self._visible_state: Optional[GameState] = None
+        
+        # Elements of each state, fixed once the _create_* methods run
+        self.elements: Dict[GameState, Tuple[UIElement, ...]] = {}
+        
+        # Action run when each button is pressed, registered as the
+        # buttons are created
+        self._button_actions: Dict[UIButton, Callable[[], None]] = {}
+        
+        # Set by the Quit Game button; the game loop stops when it sees it
+        self.quit_requested = False
         
         # Create UI elements for each state
         self._create_main_menu()
@@ -60,8 +74,8 @@ class MenuManager:
             manager=self.ui_manager
         )
         
-        role_dropdown = UIDropDownMenu(
-            options_list=[role.value for role in PlayerRole],
+        self.role_dropdown = role_dropdown = UIDropDownMenu(
+            options_list=list(PLAYER_ROLE_VALUES),
             starting_option=PlayerRole.MEDIATOR_RUPOK.value,
             relative_rect=pygame.Rect((center_x - 100, 190), (200, 30)),
             manager=self.ui_manager
@@ -86,14 +100,17 @@ class MenuManager:
             manager=self.ui_manager
         )
         
-        self.elements[GameState.MENU] = [
+        self._button_actions[start_button] = partial(self.show_state, GameState.PLAYING)
+        self._button_actions[quit_button] = self._request_quit
+        
+        self.elements[GameState.MENU] = (
             title,
             role_label,
             role_dropdown,
             start_button,
             settings_button,
             quit_button
-        ]
+        )
     
     def _create_pause_menu(self) -> None:
         """Create pause menu UI elements."""
@@ -118,47 +135,97 @@ class MenuManager:
             manager=self.ui_manager
         )
         
-        self.elements[GameState.PAUSED] = [
+        self._button_actions[resume_button] = partial(self.show_state, GameState.PLAYING)
+        self._button_actions[quit_button] = partial(self.show_state, GameState.MENU)
+        
+        self.elements[GameState.PAUSED] = (
             resume_button,
             settings_button,
             quit_button
-        ]
+        )
     
     def _create_game_hud(self) -> None:
         """Create in-game HUD elements."""
         # Player info
-        role_label = UILabel(
+        self.role_label = role_label = UILabel(
             relative_rect=pygame.Rect((10, 10), (200, 30)),
             text="Role: ",
             manager=self.ui_manager
         )
         
-        money_label = UILabel(
+        self.money_label = money_label = UILabel(
             relative_rect=pygame.Rect((10, 50), (200, 30)),
             text="Money: $0",
             manager=self.ui_manager
         )
         
         # Room info
-        room_label = UILabel(
+        self.room_label = room_label = UILabel(
             relative_rect=pygame.Rect((WINDOW_WIDTH - 210, 10), (200, 30)),
             text="Location: ",
             manager=self.ui_manager
         )
         
-        self.elements[GameState.PLAYING] = [
+        self.elements[GameState.PLAYING] = (
             role_label,
             money_label,
             room_label
-        ]
+        )
+        
+        # Values the HUD labels currently show
+        self._hud_role: Optional[str] = None
+        self._hud_money: Optional[float] = None
+        self._hud_room: Optional[str] = None
+    
+    def update_hud(
+        self,
+        *,
+        role: Optional[str] = None,
+        money: Optional[float] = None,
+        room: Optional[str] = None
+    ) -> bool:
+        """Update the HUD labels whose values changed.
+        
+        Labels are only reformatted and retitled when their value differs
+        from the one already shown; fields left as None are not touched.
+        
+        Args:
+            role: Player role name
+            money: Player money
+            room: Name of the player's room, or "" outside any room
+        
+        Returns:
+            bool: True if any label changed
+        """
+        changed = False
+        if role is not None and role != self._hud_role:
+            self._hud_role = role
+            self.role_label.set_text(f"Role: {role}")
+            changed = True
+        if money is not None and money != self._hud_money:
+            self._hud_money = money
+            self.money_label.set_text(f"Money: ${money:,.2f}")
+            changed = True
+        if room is not None and room != self._hud_room:
+            self._hud_room = room
+            self.room_label.set_text(f"Location: {room}")
+            changed = True
+        return changed
     
     def show_state(self, state: GameState) -> None:
         """Show UI elements for the given state."""
-        logger.debug(f"Showing UI state: {state}")
+        if state == self._visible_state:
+            return
+        logger.debug("Showing UI state: %s", state.name)
         
-        # Hide all elements
-        for elements in self.elements.values():
-            for element in elements:
+        # Hide only what is on screen: the previous state's elements, or
+        # everything on the first call
+        if self._visible_state is None:
+            shown = [element for elements in self.elements.values() for element in elements]
+        else:
+            shown = self.elements.get(self._visible_state, ())
+        for element in shown:
+            if element.visible:
                 element.hide()
         
         # Show elements for new state
@@ -167,21 +234,30 @@ class MenuManager:
                 element.show()
         
         self.current_state = state
+        self._visible_state = state
+    
+    @property
+    def selected_role(self) -> PlayerRole:
+        """Role currently picked in the main menu's role dropdown."""
+        return PlayerRole(self.role_dropdown.selected_option)
+    
+    @property
+    def has_visible(self) -> bool:
+        """Whether the current state shows any menu or HUD elements."""
+        return bool(self.elements.get(self.current_state))
     
     def handle_event(self, event: pygame.event.Event) -> None:
         """Handle UI events."""
-        if event.type == pygame_gui.UI_BUTTON_PRESSED:
-            button_text = event.ui_element.text
-            logger.debug(f"Button pressed: {button_text}")
+        if event.type == UI_BUTTON_PRESSED:
+            logger.debug("Button pressed: %s", event.ui_element.text)
             
-            if button_text == "Start Game":
-                self.show_state(GameState.PLAYING)
-            elif button_text == "Resume Game":
-                self.show_state(GameState.PLAYING)
-            elif button_text == "Quit Game":
-                pygame.event.post(pygame.event.Event(pygame.QUIT))
-            elif button_text == "Quit to Menu":
-                self.show_state(GameState.MENU)
+            action = self._button_actions.get(event.ui_element)
+            if action:
+                action()
+    
+    def _request_quit(self) -> None:
+        """Ask the game to quit."""
+        self.quit_requested = True
     
     def update(self, delta_time: float) -> None:
         """Update UI elements."""
@@ -7,14 +7,15 @@ This script handles initial project setup, including:
 - Initializing configuration
 """
 
+import importlib.util
 import os
 import sys
 import shutil
 from pathlib import Path
-from shared.logger import logger, setup_logger
+from shared.logger import logger, get_logger
 from shared.config import settings
 
-setup_logger = setup_logger("setup")
+setup_logger = get_logger("setup")
 
 def check_python_version() -> bool:
     """Check if Python version meets requirements.
@@ -22,7 +23,7 @@ def check_python_version() -> bool:
     Returns:
         bool: True if version is compatible, False otherwise
     """
-    required_version = (3, 8)
+    required_version = (3, 10)
     current_version = sys.version_info[:2]
     
     if current_version < required_version:
@@ -42,10 +43,12 @@ def create_directories() -> None:
         "data"
     ]
     
-    for directory in directories:
-        path = Path(directory)
+    # On reruns every directory exists, so one stat each is all it costs
+    missing = [Path(directory) for directory in directories if not Path(directory).is_dir()]
+    for path in missing:
         path.mkdir(parents=True, exist_ok=True)
-        setup_logger.info(f"Created directory: {path}")
+    if missing:
+        setup_logger.info(f"Created directories: {', '.join(map(str, missing))}")
 
 def create_env_file() -> None:
     """Create .env file if it doesn't exist."""
@@ -59,17 +62,13 @@ def check_dependencies() -> bool:
     Returns:
         bool: True if all dependencies are met, False otherwise
     """
-    try:
-        import pygame
-        import fastapi
-        import socketio
-        import sqlalchemy
-        import pytest
-        setup_logger.info("All required packages are installed")
-        return True
-    except ImportError as e:
-        setup_logger.error(f"Missing dependency: {e.name}")
-        return False
+    # Locate the packages without importing them
+    for package in ("pygame", "fastapi", "socketio", "sqlalchemy", "pytest"):
+        if importlib.util.find_spec(package) is None:
+            setup_logger.error(f"Missing dependency: {package}")
+            return False
+    setup_logger.info("All required packages are installed")
+    return True
 
 def setup_database() -> None:
     """Initialize the database."""
@@ -3,7 +3,7 @@
 This module defines constant values and enumerations used throughout the game.
 """
 
-from enum import Enum, auto
+from enum import Enum, IntEnum, auto
 from pathlib import Path
 
 # Window settings
@@ -31,7 +31,7 @@ SOUND_PATH = ASSET_DIR / "sounds"
 MAP_PATH = ASSET_DIR / "maps"
 
 # Game States
-class GameState(Enum):
+class GameState(IntEnum):
     """Possible game states."""
     MENU = auto()
     PLAYING = auto()
@@ -46,6 +46,8 @@ class PlayerRole(Enum):
     BUSINESSMAN = "Businessman"
     MAFIA = "Mafia"
 
+PLAYER_ROLE_VALUES = tuple(role.value for role in PlayerRole)
+
 # Business Types
 class BusinessType(Enum):
     """Types of businesses players can operate."""
@@ -70,6 +72,8 @@ class ResolutionMethod(Enum):
     ARBITRATION = "Arbitration"
     NEGOTIATION = "Negotiation"
 
+RESOLUTION_METHOD_VALUES = tuple(method.value for method in ResolutionMethod)
+
 # Event Types
 class EventType(Enum):
     """Game event types."""
@@ -105,10 +109,14 @@ MAX_INVENTORY_SLOTS = 20
 
 # Time Constants
 TICK_RATE = 60
+FIXED_TIMESTEP = 1.0 / TICK_RATE  # seconds per logic step
+BUSINESS_TICK = 0.1  # seconds between business simulation updates
 NETWORK_UPDATE_RATE = 20
 ANIMATION_FRAME_RATE = 8
+MAX_DELTA_TIME = 0.1  # seconds; clamps long frames (window drag, breakpoints)
+IDLE_WAIT_MS = 50  # longest event wait in menu/paused states
 
 # Map Constants
-TILE_SIZE = 32
 MAP_WIDTH = 40  # tiles
-MAP_HEIGHT = 30  # tiles 
\ No newline at end of file
+MAP_HEIGHT = 30  # tiles
+CHUNK_TILES = 8  # tiles per side of a pre-rendered map chunk 
\ No newline at end of file
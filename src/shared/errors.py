@@ -29,7 +29,10 @@ class GameError(Exception):
         
         # Log the error
         logger.error(
-            f"GameError: {message} | Code: {error_code} | Context: {context}"
+            "GameError: %s | Code: %s | Context: %s",
+            message,
+            error_code,
+            context
         )
         
         super().__init__(self.message)
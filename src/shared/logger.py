@@ -10,18 +10,32 @@ from pathlib import Path
 from logging.handlers import RotatingFileHandler
 from .config import settings
 
-# Create logs directory if it doesn't exist
+# Logs directory, created when the first record is written
 logs_dir = Path("logs")
-logs_dir.mkdir(exist_ok=True)
 
 # Configure logging format
 log_format = logging.Formatter(
     "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 )
 
+class _LazyRotatingFileHandler(RotatingFileHandler):
+    """Rotating file handler that creates its directory on first write.
+    
+    Used with delay=True, so nothing touches the filesystem until a record
+    is actually emitted.
+    """
+    
+    def _open(self):
+        """Create the log directory if needed, then open the log file."""
+        Path(self.baseFilename).parent.mkdir(parents=True, exist_ok=True)
+        return super()._open()
+
 def setup_logger(name: str) -> logging.Logger:
     """Set up a logger with the specified name.
     
+    Handlers are attached only the first time a name is set up, so calling
+    this again returns the same logger without duplicating its output.
+    
     Args:
         name: The name of the logger
         
@@ -29,6 +43,8 @@ def setup_logger(name: str) -> logging.Logger:
         logging.Logger: Configured logger instance
     """
     logger = logging.getLogger(name)
+    if logger.handlers:
+        return logger
     logger.setLevel(getattr(logging, settings.LOG_LEVEL.upper()))
     
     # Console handler
@@ -37,10 +53,11 @@ def setup_logger(name: str) -> logging.Logger:
     logger.addHandler(console_handler)
     
     # File handler
-    file_handler = RotatingFileHandler(
+    file_handler = _LazyRotatingFileHandler(
         logs_dir / settings.LOG_FILE,
         maxBytes=10485760,  # 10MB
-        backupCount=5
+        backupCount=5,
+        delay=True
     )
     file_handler.setFormatter(log_format)
     logger.addHandler(file_handler)
@@ -53,10 +70,13 @@ logger = setup_logger("vlor")
 def get_logger(name: str) -> logging.Logger:
     """Get a logger with the specified name.
     
+    The logger is a child of the default "vlor" logger. It has no handlers
+    or level of its own and writes through the default logger's.
+    
     Args:
         name: The name of the logger
         
     Returns:
         logging.Logger: Logger instance
     """
-    return setup_logger(name) 
\ No newline at end of file
+    return logger.getChild(name)
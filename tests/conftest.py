@@ -0,0 +1,14 @@
+"""Shared pytest configuration.
+
+Game modules import each other as top-level packages (``shared``,
+``client``), so the source directory is put on the import path here.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+# Run pygame without a real window
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
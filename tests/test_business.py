@@ -0,0 +1,93 @@
+"""Tests for business inventory and contracts."""
+
+import pytest
+from client.business import Business, BusinessManager, ContractSpec
+from shared.constants import BusinessType
+
+@pytest.fixture
+def business():
+    """A fresh business with no resources."""
+    return Business("Test Shop", BusinessType.RETAIL, "Tester")
+
+def test_remove_resource_unknown_name(business):
+    """Removing a resource nobody has ever held fails instead of raising."""
+    assert business.remove_resource("Never Interned Resource", 0) is False
+    assert business.remove_resource("Never Interned Resource", 5) is False
+
+def test_remove_resource_interned_elsewhere(business):
+    """A name interned by another business is simply not held here."""
+    other = Business("Other Shop", BusinessType.RETAIL, "Tester")
+    other.add_resource("Interned Elsewhere", 3, 1.0)
+    assert business.remove_resource("Interned Elsewhere", 0) is False
+    assert business.remove_resource("Interned Elsewhere", -1) is False
+
+def test_remove_resource_exhausted(business):
+    """A resource removed down to zero counts as no longer held."""
+    business.add_resource("Widgets", 4, 2.0)
+    assert business.remove_resource("Widgets", 5) is False
+    assert business.remove_resource("Widgets", 4) is True
+    assert business.quantity_of("Widgets") == 0
+    assert business.remove_resource("Widgets", 0) is False
+    assert "Widgets" not in business.resources
+
+def _state(manager):
+    """Money and stock of every business, for comparing outcomes."""
+    return {
+        name: (business.money, {n: r.quantity for n, r in business.resources.items()})
+        for name, business in manager.businesses.items()
+    }
+
+def _specs(manager, rows):
+    """Build bulk specs from (seller, buyer, resource, quantity, price) rows."""
+    b = manager.businesses
+    return [ContractSpec(b[s], b[t], resource, quantity, price) for s, t, resource, quantity, price in rows]
+
+@pytest.mark.parametrize("rows, accepted", [
+    # Middleman resells stock and spends money it received in the same batch
+    ([("Maker", "Middleman", "Steel", 6, 900.0),
+      ("Middleman", "Shop", "Steel", 4, 500.0),
+      ("Maker", "Middleman", "Steel", 4, 550.0)], 3),
+    # Invalid specs are skipped without raising
+    ([("Maker", "Shop", "Unobtainium", 0, 10.0),
+      ("Maker", "Shop", "Steel", 0, 10.0),
+      ("Maker", "Shop", "Steel", 2, 0.0),
+      ("Maker", "Shop", "Steel", -1, 10.0),
+      ("Maker", "Shop", "Steel", 2, -10.0),
+      ("Maker", "Shop", "Steel", 11, 10.0),
+      ("Maker", "Shop", "Steel", 2, 1e9),
+      ("Maker", "Shop", "Steel", 2, 20.0)], 1),
+])
+def test_bulk_contracts_match_sequential(rows, accepted):
+    """Bulk creation accepts and transfers exactly what create_contract would."""
+    sequential, bulk = BusinessManager(), BusinessManager()
+    for manager in (sequential, bulk):
+        manager.create_business("Maker", BusinessType.MANUFACTURING, "A")
+        manager.create_business("Middleman", BusinessType.RETAIL, "B")
+        manager.create_business("Shop", BusinessType.RETAIL, "C")
+        manager.businesses["Maker"].add_resource("Steel", 10, 5.0)
+    
+    expected = [
+        sequential.create_contract(spec.seller, spec.buyer, spec.resource, spec.quantity, spec.price)
+        for spec in _specs(sequential, rows)
+    ]
+    created = bulk.create_contracts_bulk(_specs(bulk, rows))
+    
+    assert len(created) == sum(c is not None for c in expected) == accepted
+    assert _state(bulk) == _state(sequential)
+
+def test_bulk_contracts_flag_parties_dirty():
+    """Both sides of a bulk trade are marked for a panel refresh."""
+    manager = BusinessManager()
+    maker = manager.create_business("Maker", BusinessType.MANUFACTURING, "A")
+    shop = manager.create_business("Shop", BusinessType.RETAIL, "B")
+    bystander = manager.create_business("Bystander", BusinessType.RETAIL, "C")
+    maker.add_resource("Steel", 10, 5.0)
+    for business in (maker, shop, bystander):
+        business.dirty = False
+    
+    manager.create_contracts_bulk([ContractSpec(maker, shop, "Steel", 3, 30.0)])
+    
+    assert maker.dirty and shop.dirty
+    assert not bystander.dirty
+    assert maker.quantity_of("Steel") == 7
+    assert shop.quantity_of("Steel") == 3
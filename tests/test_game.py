@@ -0,0 +1,49 @@
+"""Tests for the game's partial redraws."""
+
+import json
+import pygame
+import pytest
+
+game_module = pytest.importorskip("client.game")
+from shared.constants import GameState
+
+class _Keys:
+    """Keyboard state with nothing held down."""
+    
+    def __getitem__(self, key):
+        return False
+
+@pytest.fixture
+def game(tmp_path, monkeypatch):
+    """A game in the playing state whose labels draw over the scene."""
+    # A transparent label background lets stale text show through
+    (tmp_path / "theme.json").write_text(
+        json.dumps({"label": {"colours": {"dark_bg": "#00000000"}}})
+    )
+    monkeypatch.setattr(game_module, "ASSET_DIR", tmp_path)
+    game = game_module.Game()
+    game.state = GameState.PLAYING
+    game.menu_manager.show_state(GameState.PLAYING)
+    for panel in game._panels:
+        panel.hide()
+    yield game
+    game_module.Game.instance = None
+    pygame.quit()
+
+def _full_frame(game):
+    """Render the current frame from scratch."""
+    game._full_redraw = True
+    game.render()
+    return pygame.image.tostring(game.screen, "RGB")
+
+def test_hud_change_matches_full_redraw(game):
+    """A partial redraw after the HUD changes leaves no stale label text."""
+    game.update(1 / 60, _Keys())
+    _full_frame(game)
+    
+    game.player.money += 12345
+    game.update(1 / 60, _Keys())
+    game.render()
+    partial = pygame.image.tostring(game.screen, "RGB")
+    
+    assert partial == _full_frame(game)
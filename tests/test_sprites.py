@@ -0,0 +1,37 @@
+"""Tests for sprite loading and animation timing."""
+
+import pygame
+import pytest
+import client.sprites as sprites
+from client.sprites import AnimationState, Direction, SpriteManager, FRAMES_PER_ROW
+from shared.constants import PLAYER_SIZE, PlayerRole
+
+@pytest.fixture(autouse=True)
+def display():
+    """A dummy display so sheets can be converted."""
+    pygame.display.init()
+    pygame.display.set_mode((10, 10))
+    yield
+    pygame.display.quit()
+
+def test_short_sprite_sheet_falls_back(tmp_path, monkeypatch):
+    """A sheet smaller than the frame grid is replaced by the generated one."""
+    pygame.image.save(pygame.Surface((PLAYER_SIZE, PLAYER_SIZE)), str(tmp_path / "businessman.png"))
+    monkeypatch.setattr(sprites, "SPRITE_PATH", tmp_path)
+    
+    manager = SpriteManager()
+    
+    frames = manager.frames[PlayerRole.BUSINESSMAN]
+    assert len(frames) == len(Direction)
+    assert all(len(row) == FRAMES_PER_ROW for row in frames)
+    assert frames[Direction.UP][FRAMES_PER_ROW - 1].get_size() == (PLAYER_SIZE, PLAYER_SIZE)
+
+def test_animation_clock_keeps_real_time():
+    """Fixed 1/60 s steps add up to real time instead of rounding up."""
+    manager = SpriteManager()
+    manager.set_state(AnimationState.WALKING)
+    
+    for _ in range(600):
+        manager.update(1 / 60)
+    
+    assert manager.animation_ms in (9999, 10000)
@@ -0,0 +1,65 @@
+"""Tests for tilemap collision queries."""
+
+import random
+
+import pygame
+import pytest
+from client.tilemap import COLLIDABLE_TILES, TileMap, TileType, create_test_map
+from shared.constants import TILE_SIZE
+
+def _brute_force_collision(tilemap, rect):
+    """Reference check: does rect overlap any collidable tile's rect."""
+    for x in range(tilemap.width):
+        for y in range(tilemap.height):
+            tile = tilemap.get_tile(x, y)
+            if tile and tile.is_collidable:
+                tile_rect = pygame.Rect(x * TILE_SIZE, y * TILE_SIZE, TILE_SIZE, TILE_SIZE)
+                if rect.colliderect(tile_rect):
+                    return True
+    return False
+
+def _random_rects(rng, tilemap, count):
+    """Rects of at least 1 px, some partly or wholly off the map."""
+    world_w = tilemap.width * TILE_SIZE
+    world_h = tilemap.height * TILE_SIZE
+    for _ in range(count):
+        yield pygame.Rect(
+            rng.randint(-2 * TILE_SIZE, world_w + TILE_SIZE),
+            rng.randint(-2 * TILE_SIZE, world_h + TILE_SIZE),
+            rng.randint(1, 3 * TILE_SIZE),
+            rng.randint(1, 3 * TILE_SIZE)
+        )
+
+@pytest.mark.parametrize("seed", range(3))
+def test_collision_matches_brute_force_on_random_map(seed):
+    """The summed-area query agrees with checking every tile."""
+    rng = random.Random(seed)
+    tilemap = TileMap(13, 11)
+    for _ in range(60):
+        tilemap.set_tile(rng.randrange(13), rng.randrange(11), rng.choice(list(TileType)))
+    
+    for rect in _random_rects(rng, tilemap, 400):
+        assert tilemap.check_collision(rect) == _brute_force_collision(tilemap, rect), rect
+
+def test_collision_matches_brute_force_on_test_map():
+    """The bulk-loaded office map collides exactly where its tiles are."""
+    rng = random.Random(42)
+    tilemap = create_test_map()
+    for rect in _random_rects(rng, tilemap, 300):
+        assert tilemap.check_collision(rect) == _brute_force_collision(tilemap, rect), rect
+
+def test_collision_follows_tile_changes():
+    """Changing a tile's solidity updates later queries."""
+    tilemap = TileMap(4, 4)
+    for x in range(4):
+        for y in range(4):
+            tilemap.set_tile(x, y, TileType.FLOOR)
+    rect = pygame.Rect(TILE_SIZE + 4, TILE_SIZE + 4, 8, 8)
+    assert not tilemap.check_collision(rect)
+    
+    wall = next(iter(COLLIDABLE_TILES))
+    tilemap.set_tile(1, 1, wall)
+    assert tilemap.check_collision(rect)
+    
+    tilemap.set_tile(1, 1, TileType.FLOOR)
+    assert not tilemap.check_collision(rect)
@@ -0,0 +1,70 @@
+"""Tests for UI refresh tracking."""
+
+import pygame
+import pygame_gui
+import pytest
+from client.business import Business
+from client.ui.business import BusinessPanel
+from client.ui.menu import MenuManager
+from shared.constants import BusinessType
+
+@pytest.fixture
+def ui_manager():
+    """A UI manager on a dummy display."""
+    pygame.init()
+    pygame.display.set_mode((10, 10))
+    yield pygame_gui.UIManager((1280, 720))
+    pygame.display.quit()
+
+def test_update_hud_reports_changes(ui_manager):
+    """update_hud only retitles, and reports, labels whose value changed."""
+    menu = MenuManager(ui_manager)
+    
+    assert menu.update_hud(role="Rupok", money=1000.0, room="") is True
+    assert menu.role_label.text == "Role: Rupok"
+    assert menu.money_label.text == "Money: $1,000.00"
+    assert menu.room_label.text == "Location: "
+    
+    assert menu.update_hud(role="Rupok", money=1000.0, room="") is False
+    assert menu.update_hud() is False
+    
+    assert menu.update_hud(role="Rupok", money=1250.5, room="") is True
+    assert menu.money_label.text == "Money: $1,250.50"
+    assert menu.update_hud(room="Reception") is True
+    assert menu.room_label.text == "Location: Reception"
+    assert menu.role_label.text == "Role: Rupok"
+
+class _Label:
+    """Records the text a panel label is given."""
+    
+    def __init__(self):
+        self.texts = []
+    
+    def set_text(self, text):
+        self.texts.append(text)
+
+def test_business_panel_refreshes_only_when_dirty(monkeypatch):
+    """The panel rebuilds its contents only after the business changed."""
+    panel = object.__new__(BusinessPanel)
+    panel.name_label, panel.type_label, panel.money_label = _Label(), _Label(), _Label()
+    sections = []
+    for name in ("_update_resources", "_update_contracts", "_update_conflicts"):
+        monkeypatch.setattr(panel, name, lambda name=name: sections.append(name))
+    
+    business = Business("Test Shop", BusinessType.RETAIL, "Tester")
+    panel.current_business = business
+    
+    assert panel.update_display() is True
+    assert business.dirty is False
+    assert len(sections) == 3
+    
+    assert panel.update_display() is False
+    assert len(sections) == 3
+    
+    business.add_money(50)
+    assert panel.update_display() is True
+    assert panel.money_label.texts[-1] == f"Money: ${business.money:,.2f}"
+    assert len(sections) == 6
+    
+    panel.current_business = None
+    assert panel.update_display() is False